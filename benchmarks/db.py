@@ -0,0 +1,259 @@
+"""Benchmarks da camada de banco com ocorrências sintéticas.
+
+Gera ocorrências realistas a partir de `development.constants`, carrega bancos
+de 1 mil, 100 mil e 1 milhão de linhas e mede as operações de `Occurrence` e a
+paginação do `SQLiteManager`. O resultado (p50/p95/p99 e vazão) vai para JSON,
+para comparar o antes e o depois de cada mudança no banco.
+
+    python -m benchmarks.db --sizes 1k,100k --output resultados.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+from development.constants import (
+    COLORS,
+    DIRECTIONS,
+    HIGHWAYS,
+    LOCALS,
+    OTHER_PROBLEMS,
+    PROBLEMS,
+    VEHICLES_MODELS,
+)
+from development.database import ConnectionPool, SQLiteManager, count_cache, get_profile, page_cache
+from development.utils import Occurrence
+
+from .stats import summarize
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Diego", "Eduarda", "Felipe", "Gabriela", "Henrique",
+    "Isabela", "João", "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael",
+    "Sabrina", "Thiago", "Vanessa", "Wagner",
+]
+LAST_NAMES = [
+    "Almeida", "Barbosa", "Carvalho", "Costa", "Ferreira", "Gomes", "Lima", "Martins",
+    "Oliveira", "Pereira", "Ribeiro", "Rodrigues", "Santos", "Silva", "Souza",
+]
+REFERENCES = ["Posto de combustível", "Praça de pedágio", "Viaduto", "Trevo", "Ponte", "Balança"]
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+_VEHICLE_PROBLEMS = [problem for _, _, items in PROBLEMS for problem in items]
+_OTHER_PROBLEMS = [problem for _, _, items in OTHER_PROBLEMS for problem in items]
+
+
+def generate_occurrences(count: int, seed: int = 42) -> Iterator[dict]:
+    """Ocorrências sintéticas, distribuídas no último ano (reprodutíveis pela `seed`)."""
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+
+    for _ in range(count):
+        is_vehicle = rng.random() < 0.85
+        created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        record = {
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "phone": f"43 9{rng.randrange(10**7, 10**8)}",
+            "highway": rng.choice(HIGHWAYS),
+            "km": rng.randrange(0, 600),
+            "direction": rng.choice(DIRECTIONS),
+            "local": rng.choice(LOCALS),
+            "reference_point": rng.choice(REFERENCES),
+            "observations": "Solicitado apoio do guincho" if rng.random() < 0.2 else None,
+            "is_vehicle": is_vehicle,
+            "created_at": created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if is_vehicle:
+            # Placa no padrão Mercosul: ABC1D23
+            plate = (
+                "".join(rng.choice(LETTERS) for _ in range(3))
+                + str(rng.randrange(10))
+                + rng.choice(LETTERS)
+                + f"{rng.randrange(100):02d}"
+            )
+            record.update(
+                vehicle=rng.choice(VEHICLES_MODELS),
+                color=rng.choice(COLORS),
+                license_plate=plate,
+                problem=rng.choice(_VEHICLE_PROBLEMS),
+                occupantes=str(rng.randrange(1, 6)),
+            )
+        else:
+            record["problem"] = rng.choice(_OTHER_PROBLEMS)
+        yield record
+
+
+def measure(operation: Callable[[int], None], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    for i in range(warmup):
+        operation(i)
+
+    samples = []
+    for i in range(iterations):
+        # As medidas são do banco, não dos caches da aplicação
+        count_cache.invalidate()
+        page_cache.invalidate()
+        started = time.perf_counter()
+        operation(warmup + i)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def load_dataset(db_name: str, count: int, seed: int = 42) -> Dict[str, float]:
+    """Cria (ou reaproveita) o banco com `count` ocorrências."""
+    with SQLiteManager(db_name=db_name) as db:
+        existing = db.count()
+    if existing == count:
+        return {"rows": count, "reused": True}
+    if existing:
+        raise ValueError(f"{db_name} já tem {existing} ocorrências (esperado: {count}).")
+
+    report = Occurrence.bulk_save(generate_occurrences(count, seed), db_path=db_name, chunk_size=5000)
+    return {
+        "rows": report.inserted,
+        "reused": False,
+        "seconds": report.elapsed,
+        "rows_per_second": report.rows_per_second,
+    }
+
+
+def _occurrence(db_name: str, **fields) -> Occurrence:
+    occurrence = Occurrence(**fields)
+    occurrence.db_path = db_name
+    return occurrence
+
+
+def run_operations(db_name: str, rows: int, iterations: int, seed: int = 42) -> Dict[str, dict]:
+    rng = random.Random(seed)
+    records = generate_occurrences(iterations * 2 + 10, seed + 1)
+    created: List[int] = []
+    results = {}
+
+    def save(_):
+        occurrence = _occurrence(db_name, **next(records))
+        created.append(occurrence.save())
+
+    def get(_):
+        _occurrence(db_name, id=rng.randrange(1, rows + 1)).get()
+
+    def update(_):
+        occurrence = _occurrence(db_name, id=rng.randrange(1, rows + 1))
+        occurrence.get()
+        occurrence.observations = f"Atualizado {rng.random():.6f}"
+        occurrence.update()
+
+    def delete(_):
+        # Remove só as ocorrências criadas por `save`, mantendo o tamanho do banco
+        _occurrence(db_name, id=created.pop()).delete()
+
+    results["save"] = measure(save, iterations)
+    results["get"] = measure(get, iterations)
+    results["update"] = measure(update, iterations)
+    results["delete"] = measure(delete, min(iterations, len(created) - 3))
+
+    page_rows = 50
+    deep_page = max(1, int(rows / page_rows * 0.9))
+    search = "BR 376"
+
+    def page(search: Optional[str], number: int):
+        def run(_):
+            with SQLiteManager(db_name=db_name) as db:
+                db.searchPagination(search=search, page=number, rows=page_rows, compact=True)
+
+        return run
+
+    with SQLiteManager(db_name=db_name) as db:
+        search_pages = max(1, int(db.count(search) / page_rows * 0.9))
+
+    search_iterations = max(5, iterations // 4)
+    results["searchPagination.first_page"] = measure(page(None, 1), search_iterations)
+    results["searchPagination.deep_page"] = measure(page(None, deep_page), search_iterations)
+    results["searchPagination.search_first_page"] = measure(page(search, 1), search_iterations)
+    results["searchPagination.search_deep_page"] = measure(page(search, search_pages), search_iterations)
+    return results
+
+
+def run(
+    sizes: List[str],
+    iterations: int = 200,
+    data_dir: Optional[str] = None,
+    profile: Optional[str] = None,
+    seed: int = 42,
+) -> dict:
+    data_dir = data_dir or tempfile.mkdtemp(prefix="coi-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+
+    report = {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "profile": get_profile(profile).name,
+            "iterations": iterations,
+            "seed": seed,
+            "data_dir": data_dir,
+        },
+        "datasets": {},
+    }
+
+    for size in sizes:
+        rows = SIZES[size]
+        db_name = os.path.join(data_dir, f"occurrences-{size}.db")
+        ConnectionPool.instance(db_name, profile=profile)
+
+        print(f"[{size}] carregando {rows} ocorrências...", file=sys.stderr)
+        dataset = load_dataset(db_name, rows, seed)
+        print(f"[{size}] medindo operações...", file=sys.stderr)
+        report["datasets"][size] = {
+            "load": dataset,
+            "operations": run_operations(db_name, rows, iterations, seed),
+        }
+
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.db",
+        description="Benchmarks da camada de banco com ocorrências sintéticas.",
+    )
+    parser.add_argument("--sizes", default="1k,100k", help=f"tamanhos ({', '.join(SIZES)})")
+    parser.add_argument("--iterations", type=int, default=200, help="repetições por operação")
+    parser.add_argument("--data-dir", help="onde guardar os bancos (reaproveitados entre execuções)")
+    parser.add_argument("--profile", help="perfil de PRAGMAs (padrão: COI_DB_PROFILE ou 'fast')")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark-db.json", help="arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Tamanhos desconhecidos: {', '.join(unknown)} (opções: {', '.join(SIZES)})")
+
+    report = run(sizes, args.iterations, args.data_dir, args.profile, args.seed)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+    for size, dataset in report["datasets"].items():
+        for name, stats in dataset["operations"].items():
+            print(
+                f"{size:>5} {name:<36} p50 {stats['p50_ms']:8.3f} ms  "
+                f"p95 {stats['p95_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms  "
+                f"{stats['ops_per_second']:10.0f} ops/s",
+                file=sys.stderr,
+            )
+    print(f"Resultados em {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
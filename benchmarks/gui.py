@@ -0,0 +1,338 @@
+"""Benchmarks de cenários da interface, na plataforma `offscreen` do Qt.
+
+Abre o `main.App` sobre bancos sintéticos (os mesmos de `benchmarks.db`) e
+mede, por cenário, o tempo de parede, o tempo em que o loop de eventos ficou
+travado e a contagem de widgets/objetos, para pegar regressões de interface
+numa máquina Linux sem tela.
+
+    python -m benchmarks.gui --sizes 1k,100k --output gui.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+_import_started = time.perf_counter()
+import main  # noqa: E402
+from PySide6 import __version__ as pyside_version  # noqa: E402
+from PySide6.QtCore import QEvent, QEventLoop, QObject, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from development.database import ConnectionPool, count_cache, page_cache  # noqa: E402
+from development.elements import CTable  # noqa: E402
+
+from .db import SIZES, load_dataset  # noqa: E402
+from .stats import summarize  # noqa: E402
+
+IMPORT_SECONDS = time.perf_counter() - _import_started
+
+# Intervalos acima disto contam como travamento (uma tarefa longa, como nos navegadores)
+STALL_THRESHOLD_MS = 50
+
+
+class LoopMonitor(QObject):
+    """Batimento a cada `interval` ms; intervalos longos entre batidas são travamentos do loop."""
+
+    def __init__(self, interval: int = 5, threshold_ms: float = STALL_THRESHOLD_MS):
+        super().__init__()
+        self.threshold = threshold_ms / 1000
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._beat)
+        self._last = 0.0
+        self.max_gap = 0.0
+        self.stalled = 0.0
+        self.stalls = 0
+
+    def start(self) -> None:
+        self.max_gap = self.stalled = 0.0
+        self.stalls = 0
+        self._last = time.perf_counter()
+        self._timer.start()
+
+    def stop(self) -> Dict[str, float]:
+        self._beat()
+        self._timer.stop()
+        return {
+            "max_stall_ms": self.max_gap * 1000,
+            "stalled_ms": self.stalled * 1000,
+            "stalls": self.stalls,
+        }
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        gap, self._last = now - self._last, now
+        self.max_gap = max(self.max_gap, gap)
+        if gap > self.threshold:
+            self.stalled += gap
+            self.stalls += 1
+
+
+def run_until(action: Callable[[], None], done: Callable[[], bool], timeout: float = 30.0) -> float:
+    """Executa `action` dentro do loop de eventos e gira o loop até `done()`; retorna os segundos."""
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout
+    poll = QTimer()
+    poll.setInterval(1)
+
+    def check():
+        if done() or time.perf_counter() > deadline:
+            poll.stop()
+            loop.quit()
+
+    poll.timeout.connect(check)
+    started = time.perf_counter()
+    QTimer.singleShot(0, lambda: (action(), poll.start()))
+    loop.exec()
+    elapsed = time.perf_counter() - started
+    if not done():
+        raise TimeoutError("Cenário não terminou no tempo limite.")
+    return elapsed
+
+
+def object_counts(window) -> Dict[str, int]:
+    return {
+        "widgets": len(QApplication.allWidgets()),
+        "objects": len(window.findChildren(QObject)) if window is not None else 0,
+    }
+
+
+def settle(window) -> bool:
+    """True quando a janela terminou a inicialização e não há lote carregando."""
+    model = window.occurrences_model
+    return (
+        window.startup.first_frame_done()
+        and window.table_panel is not None
+        and not model.isLoading()
+        and model.rowCount() > 0
+    )
+
+
+class Scenario:
+    """Cenário medido: `action` roda no loop e `done` diz quando o resultado está na tela."""
+
+    def __init__(
+        self,
+        name: str,
+        action: Callable[[], None],
+        done: Callable[[], bool] = lambda: True,
+        before: Callable[[], None] = None,
+        after: Callable[[], None] = None,
+    ):
+        self.name = name
+        self.action = action
+        self.done = done
+        self.before = before
+        self.after = after
+
+
+def measure(scenario: Scenario, iterations: int, window_of: Callable[[], object]) -> dict:
+    monitor = LoopMonitor()
+    samples: List[float] = []
+    stalls: List[Dict[str, float]] = []
+    counts_before = object_counts(window_of())
+
+    for _ in range(iterations):
+        if scenario.before:
+            scenario.before()
+        monitor.start()
+        samples.append(run_until(scenario.action, scenario.done))
+        stalls.append(monitor.stop())
+        if scenario.after:
+            scenario.after()
+
+    counts_after = object_counts(window_of())
+    return {
+        "wall": summarize(samples),
+        "loop": {
+            "max_stall_ms": max(s["max_stall_ms"] for s in stalls),
+            "mean_stalled_ms": sum(s["stalled_ms"] for s in stalls) / len(stalls),
+            "stalls": sum(s["stalls"] for s in stalls),
+        },
+        "counts": {"before": counts_before, "after": counts_after},
+    }
+
+
+def _clear_caches() -> None:
+    count_cache.invalidate()
+    page_cache.invalidate()
+
+
+def run_scenarios(app: QApplication, db_name: str, iterations: int) -> Dict[str, dict]:
+    state: Dict[str, Optional[main.App]] = {"window": None}
+
+    def open_window():
+        window = main.App(db_name=db_name)
+        window.resize(1300, 700)
+        window.show()
+        state["window"] = window
+
+    def close_window():
+        window = state["window"]
+        state["window"] = None
+        window.close()
+        window.deleteLater()
+        window.db_worker.wait()
+        # Sem isto o `deleteLater` só roda no fim do loop e as janelas se acumulam
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        app.processEvents()
+
+    results = {}
+    window_of = lambda: state["window"]
+
+    results["startup"] = measure(
+        Scenario(
+            "startup",
+            open_window,
+            done=lambda: state["window"] is not None and settle(state["window"]),
+            before=_clear_caches,
+            after=close_window,
+        ),
+        max(3, iterations // 4),
+        window_of,
+    )
+
+    open_window()
+    run_until(lambda: None, lambda: settle(state["window"]))
+    window = state["window"]
+    model = window.occurrences_model
+    loaded = lambda: not model.isLoading() and model.rowCount() > 0
+
+    results["load_page"] = measure(
+        Scenario("load_page", window.load_page, done=loaded, before=_clear_caches),
+        iterations,
+        window_of,
+    )
+    results["load_page_cached"] = measure(
+        Scenario("load_page_cached", window.load_page, done=loaded), iterations, window_of
+    )
+
+    target = model.batch_size * 10
+
+    def scroll_done():
+        if model.rowCount() >= target or not model.canFetchMore() and not model.isLoading():
+            return True
+        if not model.isLoading():
+            window.table_occurrences.scrollToBottom()
+        return False
+
+    results["scroll_10_batches"] = measure(
+        Scenario(
+            "scroll_10_batches",
+            window.table_occurrences.scrollToBottom,
+            done=scroll_done,
+            before=lambda: (_clear_caches(), model.refresh()),
+        ),
+        max(3, iterations // 4),
+        window_of,
+    )
+
+    def restyle_table():
+        window.table_occurrences.update_styles()
+        window.table_occurrences.viewport().repaint()
+
+    results["table_update_styles"] = measure(
+        Scenario("table_update_styles", restyle_table), iterations, window_of
+    )
+
+    def toggle():
+        window.toggle_theme()
+        window.scheduler.flush("theme")
+        window.repaint()
+
+    results["toggle_theme"] = measure(Scenario("toggle_theme", toggle), iterations, window_of)
+
+    # A tabela de widgets (`CTable`) não é mais usada pela janela, mas segue no pacote
+    table = CTable(columns=len(model.HEADERS))
+    table.resize(1200, 585)
+    table.show()
+    for row in range(200):
+        table.add_row([str(row), "Nome", "43 999999999", "BR 376", "123", "Crescente", "Pane", "Pista", "Posto"])
+
+    def restyle_ctable():
+        table.update_styles()
+        table.viewport().repaint()
+
+    results["ctable_update_styles"] = measure(
+        Scenario("ctable_update_styles", restyle_ctable), iterations, lambda: table
+    )
+    table.close()
+    table.deleteLater()
+    close_window()
+    return results
+
+
+def run(sizes: List[str], iterations: int = 20, data_dir: Optional[str] = None) -> dict:
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    data_dir = data_dir or tempfile.mkdtemp(prefix="coi-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+
+    report = {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "qpa_platform": app.platformName(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "stall_threshold_ms": STALL_THRESHOLD_MS,
+            "import_main_ms": IMPORT_SECONDS * 1000,
+            "data_dir": data_dir,
+        },
+        "datasets": {},
+    }
+
+    for size in sizes:
+        db_name = os.path.join(data_dir, f"occurrences-{size}.db")
+        ConnectionPool.instance(db_name)
+        print(f"[{size}] carregando {SIZES[size]} ocorrências...", file=sys.stderr)
+        dataset = load_dataset(db_name, SIZES[size])
+        print(f"[{size}] medindo cenários...", file=sys.stderr)
+        report["datasets"][size] = {"load": dataset, "scenarios": run_scenarios(app, db_name, iterations)}
+
+    return report
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.gui",
+        description="Benchmarks de cenários da interface (plataforma offscreen).",
+    )
+    parser.add_argument("--sizes", default="1k,100k", help=f"tamanhos ({', '.join(SIZES)})")
+    parser.add_argument("--iterations", type=int, default=20, help="repetições por cenário")
+    parser.add_argument("--data-dir", help="onde guardar os bancos (reaproveitados entre execuções)")
+    parser.add_argument("--output", default="benchmark-gui.json", help="arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Tamanhos desconhecidos: {', '.join(unknown)} (opções: {', '.join(SIZES)})")
+
+    report = run(sizes, args.iterations, args.data_dir)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+    for size, dataset in report["datasets"].items():
+        for name, result in dataset["scenarios"].items():
+            wall, loop, counts = result["wall"], result["loop"], result["counts"]
+            print(
+                f"{size:>5} {name:<22} p50 {wall['p50_ms']:8.2f} ms  p95 {wall['p95_ms']:8.2f} ms  "
+                f"travado {loop['max_stall_ms']:7.1f} ms  "
+                f"widgets {counts['before']['widgets']}→{counts['after']['widgets']}",
+                file=sys.stderr,
+            )
+    print(f"Resultados em {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,25 @@
+import math
+from typing import Dict, List
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Percentil pelo posto mais próximo (amostras já ordenadas)."""
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1, math.ceil(fraction * len(samples)) - 1))
+    return samples[rank]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latências em milissegundos e vazão (operações por segundo)."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "mean_ms": total / len(ordered) * 1000 if ordered else 0.0,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        "ops_per_second": len(ordered) / total if total else 0.0,
+    }
@@ -1 +1,17 @@
-from .modules import *
\ No newline at end of file
+# Os nomes de `development.modules` (Qt, componentes, elementos...) só são
+# carregados no primeiro acesso: quem importa um subpacote direto, como
+# `development.database`, não paga pelo PySide inteiro na inicialização.
+from importlib import import_module
+
+
+def __getattr__(name: str):
+    if name.startswith("__"):
+        raise AttributeError(name)
+
+    modules = import_module(".modules", __name__)
+    try:
+        value = getattr(modules, name)
+    except AttributeError:
+        raise AttributeError(f"módulo 'development' não possui o atributo '{name}'") from None
+    globals()[name] = value
+    return value
\ No newline at end of file
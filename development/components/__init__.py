@@ -2,3 +2,5 @@ from .main_window import CMainWindow
 from .navbar import Navbar
 from .occurrence_form import OccurrenceForm
 from .edit_occurrence_form import OccurrenceEditForm
+from .occurrence_table_model import OccurrenceTableModel
+from .search_pipeline import SearchPipeline
\ No newline at end of file
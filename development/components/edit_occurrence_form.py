@@ -1,7 +1,5 @@
 from PySide6.QtWidgets import QDialog, QSpacerItem, QSizePolicy
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QStandardItem
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QByteArray, Qt
+from PySide6.QtGui import QColor, QFont, QStandardItem
 from development.styles import (
     Colors,
     Border,
@@ -9,6 +7,7 @@ from development.styles import (
     Border,
     BorderRadius,
     Padding,
+    icon_cache,
 )
 from development.elements import (
     CTooltip,
@@ -24,9 +23,7 @@ from development.elements import (
 )
 from development.model import Instances
 from development.constants import *
-from ..utils import Occurrence
-import base64
-import os
+from ..utils import DatabaseWorker, Occurrence
 
 
 class OccurrenceEditForm(QDialog, Instances):
@@ -50,6 +47,7 @@ class OccurrenceEditForm(QDialog, Instances):
         input_border: Border = Border(color=Colors.gray.adjust_tonality(85)),
         padding: Padding = None,
         update_table: callable = None,
+        db_worker: DatabaseWorker = None,
     ):
         QDialog.__init__(self)
         Instances.__init__(
@@ -72,6 +70,8 @@ class OccurrenceEditForm(QDialog, Instances):
         self.occurrence = occurrence
         self.is_vehicle = True
         self.update_table = update_table
+        # Worker do banco da janela; sem ele, o compartilhado (banco padrão)
+        self.db_worker = db_worker
         self._input_bg_color = input_bg_color
         self._input_border = input_border
 
@@ -137,44 +137,7 @@ class OccurrenceEditForm(QDialog, Instances):
 
     def setIcon(self, source: str | bytes):
         """Define um ícone para a janela a partir de um arquivo ou Base64 (suporte para PNG, JPG e SVG)."""
-        if os.path.exists(source):
-            icon = QIcon(source)  # Arquivo de imagem ou SVG
-        else:
-            icon = self.__load_icon_from_base64(source)
-
-        self.setWindowIcon(icon)
-
-    def __load_icon_from_base64(self, base64_str):
-        """Converte uma string Base64 em um QIcon, suportando PNG, JPG e SVG."""
-        try:
-            image_data = base64.b64decode(base64_str)
-
-            # Verifica se o dado é um SVG
-            if b"<svg" in image_data:
-                return self.__convert_svg_to_icon(image_data)
-
-            # Caso contrário, assume que é PNG/JPG
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
-            return QIcon(pixmap)
-        except Exception:
-            return QIcon()
-
-    def __convert_svg_to_icon(self, svg_data):
-        """Converte um arquivo SVG Base64 em um QIcon."""
-        try:
-            renderer = QSvgRenderer(QByteArray(svg_data))
-            pixmap = QPixmap(128, 128)
-            pixmap.fill(Qt.transparent)
-
-            # Renderiza o SVG no pixmap
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            return QIcon(pixmap)
-        except Exception:
-            return QIcon()
+        self.setWindowIcon(icon_cache.icon(source))
 
     def ui_inputs(self):
         self.input_name = CSelect(
@@ -368,7 +331,7 @@ class OccurrenceEditForm(QDialog, Instances):
             )
 
         try:
-            from development.modules import Occurrence
+            from development.utils import Occurrence
 
             self.new_occurrence = Occurrence(
                 name=self.form_occurrence.get("name"),
@@ -416,7 +379,7 @@ class OccurrenceEditForm(QDialog, Instances):
         }
 
         try:
-            from development.modules import Occurrence
+            from development.utils import Occurrence
 
             self.new_occurrence = Occurrence(
                 id=self.form_occurrence.get("id"),
@@ -436,19 +399,29 @@ class OccurrenceEditForm(QDialog, Instances):
                 is_vehicle=self.is_vehicle,
             )
 
-            self.new_occurrence.update()
-            self.new_occurrence.clipboard()
-            message = CMessageBox(
-                self, title="Notificação", text="Ocorrência atualizada!"
+            self.btn_save.setEnabled(False)
+            (self.db_worker or DatabaseWorker.instance()).update(self.new_occurrence).then(
+                self.__on_updated, self.__on_update_error
             )
-            message.show()
-            self.destroy(True)
 
         except Exception as e:
-            message = CMessageBox(
-                self, title="Atenção", text=str(e), icon_type=CMessageBox.Icon.critical
-            )
-            message.show()
+            self.__on_update_error(e)
+
+    def __on_updated(self, _):
+        self.btn_save.setEnabled(True)
+        self.new_occurrence.clipboard()
+        message = CMessageBox(
+            self, title="Notificação", text="Ocorrência atualizada!"
+        )
+        message.show()
+        self.destroy(True)
+
+    def __on_update_error(self, e: Exception):
+        self.btn_save.setEnabled(True)
+        message = CMessageBox(
+            self, title="Atenção", text=str(e), icon_type=CMessageBox.Icon.critical
+        )
+        message.show()
 
     def alter_form(self, event):
         self.is_vehicle = not self.is_vehicle
@@ -467,25 +440,7 @@ class OccurrenceEditForm(QDialog, Instances):
             self.title_label.setText("Formulário completo")
 
     def other_problems(self):
-        self.add_title("─── Animais Soltos ───", "#00AC0B")
-        self.input_problem.combo_box.addItems(
-            [
-                "Equino solto na via",
-                "Bovino solto na via",
-                "Suíno solto na via",
-                "Canino solto na via",
-            ]
-        )
-
-        self.add_title("─── Animais Mortos ───", "#C41111")
-        self.input_problem.combo_box.addItems(
-            [
-                "Equino morto na via",
-                "Bovino morto na via",
-                "Suíno morto na via",
-                "Canino morto na via",
-            ]
-        )
+        self.add_problems(OTHER_PROBLEMS)
         if self.occurrence.problem:
             self.input_problem.combo_box.insertItem(0, self.occurrence.problem)
             self.input_problem.combo_box.setCurrentText(self.occurrence.problem)
@@ -519,6 +474,11 @@ class OccurrenceEditForm(QDialog, Instances):
         else:
             self.input_problem.combo_box.setCurrentIndex(-1)
 
+    def add_problems(self, groups):
+        for title, color, problems in groups:
+            self.add_title(f"─── {title} ───", color)
+            self.input_problem.combo_box.addItems(problems)
+
     def add_title(self, title, color):
         """Adiciona um título desabilitado e colorido no QComboBox"""
         self.input_problem.combo_box.addItem(title)
@@ -675,7 +635,7 @@ class OccurrenceEditForm(QDialog, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
 
         inputs: list[CInput] = [
             self.input_name,
@@ -1,12 +1,7 @@
 from PySide6.QtWidgets import QMainWindow
-from PySide6.QtGui import QIcon, QPixmap, QPainter
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QByteArray, Qt
-from development.styles import Colors, Border, type_border
+from development.styles import Colors, Border, type_border, icon_cache
 from development.elements import CTooltip
 from development.model import Instances
-import base64
-import os
 
 
 class CMainWindow(QMainWindow, Instances):
@@ -108,46 +103,9 @@ class CMainWindow(QMainWindow, Instances):
             {label}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
         self.update()
 
     def setIcon(self, source: str | bytes):
         """Define um ícone para a janela a partir de um arquivo ou Base64 (suporte para PNG, JPG e SVG)."""
-        if os.path.exists(source):
-            icon = QIcon(source)  # Arquivo de imagem ou SVG
-        else:
-            icon = self.__load_icon_from_base64(source)
-
-        self.setWindowIcon(icon)
-
-    def __load_icon_from_base64(self, base64_str):
-        """Converte uma string Base64 em um QIcon, suportando PNG, JPG e SVG."""
-        try:
-            image_data = base64.b64decode(base64_str)
-
-            # Verifica se o dado é um SVG
-            if b"<svg" in image_data:
-                return self.__convert_svg_to_icon(image_data)
-
-            # Caso contrário, assume que é PNG/JPG
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
-            return QIcon(pixmap)
-        except Exception:
-            return QIcon()
-
-    def __convert_svg_to_icon(self, svg_data):
-        """Converte um arquivo SVG Base64 em um QIcon."""
-        try:
-            renderer = QSvgRenderer(QByteArray(svg_data))
-            pixmap = QPixmap(128, 128)
-            pixmap.fill(Qt.transparent)
-
-            # Renderiza o SVG no pixmap
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            return QIcon(pixmap)
-        except Exception:
-            return QIcon()
+        self.setWindowIcon(icon_cache.icon(source))
@@ -93,7 +93,7 @@ class Navbar(QFrame, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
         self.update()
 
     def add_to_layout(self, widgets: list[QWidget | QLayout]):
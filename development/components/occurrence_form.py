@@ -1,3 +1,5 @@
+from functools import partial
+
 from PySide6.QtWidgets import QFrame, QSpacerItem, QSizePolicy
 from development.styles import (
     Colors,
@@ -20,6 +22,7 @@ from development.elements import (
     CSelect,
 )
 from development.model import Instances
+from development.utils import DatabaseWorker
 from development.constants import *
 from PySide6.QtGui import QColor, QFont, QStandardItem
 
@@ -44,6 +47,7 @@ class OccurrenceForm(QFrame, Instances):
         input_border: Border = Border(color=Colors.gray.adjust_tonality(85)),
         padding: Padding = None,
         update_table: callable = None,
+        db_worker: DatabaseWorker = None,
     ):
         QFrame.__init__(self)
         Instances.__init__(
@@ -65,6 +69,10 @@ class OccurrenceForm(QFrame, Instances):
         )
         self.is_vehicle = True
         self.update_table = update_table
+        # Worker do banco da janela; sem ele, o compartilhado (banco padrão)
+        self.db_worker = db_worker
+        # Um salvamento por vez: Ctrl+Enter chama `save_form` sem passar pelo botão
+        self.saving = False
         self._input_bg_color = input_bg_color
         self._input_border = input_border
 
@@ -299,6 +307,9 @@ class OccurrenceForm(QFrame, Instances):
         }
 
     def save_form(self):
+        if self.saving:
+            return
+
         self.form_occurrence = {
             "is_vehicle": self.is_vehicle,
             "name": self.input_name.currentText() or "Usuário",
@@ -317,7 +328,7 @@ class OccurrenceForm(QFrame, Instances):
         }
         
         try:
-            from development.modules import Occurrence
+            from development.utils import Occurrence
 
             self.new_occurrence = Occurrence(
                 name=self.form_occurrence.get("name"),
@@ -336,20 +347,35 @@ class OccurrenceForm(QFrame, Instances):
                 is_vehicle=self.is_vehicle,
             )
 
-            self.new_occurrence.save()
-            self.new_occurrence.clipboard()
-            self.clear_form()
-            message = CMessageBox(
-                self, title="Notificação", text="Formulário salvo com sucesso!"
+            # O INSERT roda fora da thread da interface; o resto acontece ao concluir
+            self.saving = True
+            self.btn_save.setEnabled(False)
+            (self.db_worker or DatabaseWorker.instance()).save(self.new_occurrence).then(
+                partial(self.__on_saved, self.new_occurrence), self.__on_save_error
             )
-            self.update_table()
-            message.show()
 
         except Exception as e:
-            message = CMessageBox(
-                self, title="Atenção", text=str(e), icon_type=CMessageBox.Icon.critical
-            )
-            message.show()
+            self.__on_save_error(e)
+
+    def __on_saved(self, occurrence, id: int):
+        self.saving = False
+        self.btn_save.setEnabled(True)
+        occurrence.clipboard()
+        self.clear_form()
+        message = CMessageBox(
+            self, title="Notificação", text="Formulário salvo com sucesso!"
+        )
+        if self.update_table:
+            self.update_table()
+        message.show()
+
+    def __on_save_error(self, e: Exception):
+        self.saving = False
+        self.btn_save.setEnabled(True)
+        message = CMessageBox(
+            self, title="Atenção", text=str(e), icon_type=CMessageBox.Icon.critical
+        )
+        message.show()
 
     def alter_form(self, event):
         self.is_vehicle = not self.is_vehicle
@@ -368,50 +394,18 @@ class OccurrenceForm(QFrame, Instances):
             self.title_label.setText("Formulário completo")
 
     def other_problems(self):
-        self.add_title("─── Animais Soltos ───", "#00AC0B")
-        self.input_problem.combo_box.addItems(
-            [
-                "Equino solto na via",
-                "Bovino solto na via",
-                "Suíno solto na via",
-                "Canino solto na via",
-            ]
-        )
-
-        self.add_title("─── Animais Mortos ───", "#C41111")
-        self.input_problem.combo_box.addItems(
-            [
-                "Equino morto na via",
-                "Bovino morto na via",
-                "Suíno morto na via",
-                "Canino morto na via",
-            ]
-        )
+        self.add_problems(OTHER_PROBLEMS)
         self.input_problem.combo_box.setCurrentIndex(-1)
 
     def problems(self):
-        self.add_title("─── Mecânicos ───", "darkgreen")
-        self.input_problem.combo_box.addItems(["Pane Mecânica", "Pane Elétrica"])
-
-        self.add_title("─── Acidentes ───", "#C41111")
-        self.input_problem.combo_box.addItems(
-            [
-                "Sinistro / Colisão",
-                "Sinistro / Tombamento",
-                "Sinistro / Capotamento",
-                "Sinistro / Saída de pista",
-            ]
-        )
-
-        self.add_title("─── Pneus ───", "darkorange")
-        self.input_problem.combo_box.addItems(
-            [
-                "Pneu furado / Danificado, possui estepe: Sim",
-                "Pneu furado / Danificado, possui estepe: Não",
-            ]
-        )
+        self.add_problems(PROBLEMS)
         self.input_problem.combo_box.setCurrentIndex(-1)
 
+    def add_problems(self, groups):
+        for title, color, problems in groups:
+            self.add_title(f"─── {title} ───", color)
+            self.input_problem.combo_box.addItems(problems)
+
     def add_title(self, title, color):
         """Adiciona um título desabilitado e colorido no QComboBox"""
         self.input_problem.combo_box.addItem(title)
@@ -566,7 +560,7 @@ class OccurrenceForm(QFrame, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
 
         inputs: list[CInput] = [
             self.input_name,
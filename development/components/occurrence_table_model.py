@@ -0,0 +1,256 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from typing import Callable, Optional
+from development.database import ResponseSearch, SQLiteManager, OccurrenceRow, page_cache, page_key
+from development.utils import DatabaseWorker, DatabaseFuture, profiled
+
+
+class OccurrenceTableModel(QAbstractTableModel):
+    """Modelo das ocorrências que busca linhas do banco sob demanda.
+
+    A view pede mais linhas (`canFetchMore`/`fetchMore`) conforme a rolagem se
+    aproxima do fim; cada lote é uma página por cursor (keyset), então o custo
+    de buscar o lote 500 é o mesmo do primeiro.
+
+    Com um `worker`, os lotes são buscados fora da thread da interface e
+    inseridos quando chegam; respostas de buscas já substituídas são ignoradas.
+    Os lotes passam pelo `page_cache`: depois de cada lote o seguinte já é
+    buscado em segundo plano, e lotes em cache entram sem ir ao banco, um por
+    ciclo do loop de eventos.
+    """
+
+    rowsLoaded = Signal(int)
+    loadFailed = Signal(object)
+
+    HEADERS = [
+        "ID",
+        "Nome",
+        "Telefone",
+        "Rodovia",
+        "Km",
+        "Sentido",
+        "Problema",
+        "Encontra-se",
+        "Ponto de referência",
+        "Ações",
+    ]
+    FIELDS = (
+        "id",
+        "name",
+        "phone",
+        "highway",
+        "km",
+        "direction",
+        "problem",
+        "local",
+        "reference_point",
+    )
+    ACTION_COLUMN = len(FIELDS)
+
+    def __init__(
+        self,
+        db_name: str = "app/database/database.db",
+        batch_size: int = 50,
+        fetch_page: Callable[[Optional[str], Optional[str], int], ResponseSearch] = None,
+        worker: DatabaseWorker = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self.fetch_page = fetch_page or self._fetch_page
+        self.worker = worker
+        self.search: Optional[str] = None
+        self.total_rows = 0
+
+        self._rows: list[OccurrenceRow] = []
+        self._by_id: dict[int, OccurrenceRow] = {}
+        self._next_cursor: Optional[str] = None
+        self._has_more = True
+        self._pending: Optional[DatabaseFuture] = None
+        self._prefetch: Optional[DatabaseFuture] = None
+        self._prefetch_cursor: Optional[str] = None
+        self._generation = 0
+
+    @profiled("load_page")
+    def _fetch_page(self, search: Optional[str], cursor: Optional[str], rows: int) -> ResponseSearch:
+        with SQLiteManager(db_name=self.db_name) as db:
+            return db.searchCursor(search=search, cursor=cursor, rows=rows, compact=True, cache=True)
+
+    def _cached(self, cursor: Optional[str]) -> Optional[ResponseSearch]:
+        # Só o `_fetch_page` padrão passa pelo cache
+        if self.fetch_page != self._fetch_page:
+            return None
+        return page_cache.get(self.db_name, page_key("cursor", self.search, cursor, self.batch_size))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole and column < self.ACTION_COLUMN:
+            value = getattr(row, self.FIELDS[column])
+            return "" if value is None else str(value)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ToolTipRole and column == self.ACTION_COLUMN:
+            return f"ID: {row.id}"
+        if role == Qt.UserRole:
+            return row
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and self._pending is None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        generation = self._generation
+        cached = self._cached(self._next_cursor)
+        if self.worker is None:
+            if cached is None:
+                cached = self.fetch_page(self.search, self._next_cursor, self.batch_size)
+            self._apply(generation, cached)
+            return
+
+        if cached is not None:
+            # Um lote por ciclo do loop: a view pede o próximo assim que recebe
+            # as linhas, e aplicar os lotes em cache em sequência trava a interface
+            future = self.worker.resolved(cached)
+        else:
+            future = self._take_prefetch(self._next_cursor) or self.worker.submit(
+                self.fetch_page, self.search, self._next_cursor, self.batch_size
+            )
+        self._pending = future.then(
+            lambda response: self._apply(generation, response),
+            lambda error: self._failed(generation, error),
+        )
+
+    def _take_prefetch(self, cursor: Optional[str]) -> Optional[DatabaseFuture]:
+        """Prefetch ainda em andamento para o mesmo lote, para não consultar duas vezes."""
+        prefetch, self._prefetch = self._prefetch, None
+        # Já concluído, o resultado está no cache (ou foi descartado por uma escrita)
+        if prefetch is None or prefetch.done() or self._prefetch_cursor != cursor:
+            return None
+        return prefetch
+
+    def _prefetch_next(self) -> None:
+        if self.worker is None or not self._has_more or self.fetch_page != self._fetch_page:
+            return
+        key = page_key("cursor", self.search, self._next_cursor, self.batch_size)
+        if page_cache.peek(self.db_name, key) is not None:
+            return
+
+        self._prefetch_cursor = self._next_cursor
+        self._prefetch = self.worker.submit(
+            self.fetch_page, self.search, self._next_cursor, self.batch_size
+        )
+
+    def isLoading(self) -> bool:
+        return self._pending is not None
+
+    def _failed(self, generation: int, error: Exception) -> None:
+        if generation != self._generation:
+            return
+        self._pending = None
+        self._has_more = False
+        self.loadFailed.emit(error)
+
+    @profiled("load_page_fill")
+    def _apply(self, generation: int, response: ResponseSearch) -> None:
+        if generation != self._generation:
+            return
+        self._pending = None
+
+        self.total_rows = response.total_rows
+        self._next_cursor = response.next_cursor
+        self._has_more = response.next_cursor is not None
+
+        # Evita duplicar linhas caso algo tenha sido inserido entre os lotes
+        data = [row for row in response.data if row.id not in self._by_id]
+        if data:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(data) - 1)
+            self._rows.extend(data)
+            self._by_id.update((row.id, row) for row in data)
+            self.endInsertRows()
+
+        self.rowsLoaded.emit(self.total_rows)
+        self._prefetch_next()
+
+    def _reset(self, has_more: bool) -> None:
+        # Respostas ainda a caminho pertencem à busca anterior e serão descartadas
+        self._generation += 1
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        if self._prefetch is not None:
+            if not self._prefetch.done():
+                self._prefetch.cancel()
+            self._prefetch = None
+
+        self.beginResetModel()
+        self._rows = []
+        self._by_id = {}
+        self._next_cursor = None
+        self._has_more = has_more
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove todas as linhas sem buscar novamente no banco."""
+        self._reset(has_more=False)
+
+    def refresh(self) -> None:
+        """Descarta as linhas carregadas e busca o primeiro lote outra vez."""
+        self._reset(has_more=True)
+        self.fetchMore()
+
+    def set_search(self, search: Optional[str]) -> None:
+        self.search = search or None
+        self.refresh()
+
+    def is_complete(self) -> bool:
+        """True quando todas as linhas da busca atual já estão carregadas."""
+        return not self._has_more and self._pending is None
+
+    def narrow(self, search: str, predicate: Callable[[OccurrenceRow], bool]) -> bool:
+        """Aplica uma busca mais restrita filtrando as linhas já carregadas, sem ir ao banco.
+
+        Só vale quando o conjunto atual está completo; retorna False caso contrário.
+        """
+        if not self.is_complete():
+            return False
+
+        rows = [row for row in self._rows if predicate(row)]
+        self._reset(has_more=False)
+        self.search = search or None
+
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self._rows = rows
+            self._by_id = {row.id: row for row in rows}
+            self.endInsertRows()
+
+        self.total_rows = len(rows)
+        self.rowsLoaded.emit(self.total_rows)
+        return True
+
+    def row(self, row: int) -> OccurrenceRow:
+        return self._rows[row]
+
+    def find(self, id: int) -> Optional[OccurrenceRow]:
+        """Linha já carregada com o id informado, se houver."""
+        return self._by_id.get(int(id))
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from development.database import loaded_engine
+from development.utils import RefreshScheduler
+from .occurrence_table_model import OccurrenceTableModel
+
+
+class SearchPipeline(QObject):
+    """Liga uma caixa de busca ao modelo da tabela sem travar a digitação.
+
+    - espera a digitação parar por `delay` ms antes de consultar (debounce);
+    - uma busca nova descarta a anterior ainda em andamento;
+    - quando o termo novo só acrescenta texto ao anterior e o resultado anterior
+      já está todo carregado, filtra essas linhas em memória em vez de ir ao banco.
+    """
+
+    searchChanged = Signal(str)
+
+    def __init__(
+        self,
+        model: OccurrenceTableModel,
+        scheduler: RefreshScheduler = None,
+        delay: int = 250,
+        parent: QObject = None,
+    ):
+        super().__init__(parent)
+        self.model = model
+        self.scheduler = scheduler or RefreshScheduler(self)
+        self.delay = delay
+        self._pending: Optional[str] = None
+
+    @property
+    def search(self) -> Optional[str]:
+        return self.model.search
+
+    def set_text(self, text: str) -> None:
+        """Recebe o texto digitado (ligar em `textChanged`)."""
+        self._pending = text.strip()
+        self.scheduler.schedule("search", self._run, delay=self.delay)
+
+    def apply(self, text: Optional[str] = None) -> None:
+        """Executa imediatamente a busca pendente ou a informada."""
+        if text is not None:
+            self._pending = text.strip()
+        self.scheduler.cancel("search")
+        self._run()
+
+    def _run(self) -> None:
+        search = self._pending
+        self._pending = None
+        if search is None:
+            return
+
+        previous = self.model.search or ""
+        if search == previous:
+            return
+
+        if not self._narrow(previous, search):
+            self.model.set_search(search)
+        self.searchChanged.emit(search)
+
+    def _narrow(self, previous: str, search: str) -> bool:
+        if not search or not self.model.is_complete():
+            return False
+
+        engine = loaded_engine(self.model.db_name)
+        if engine is None:
+            return False
+        # Sem busca anterior o modelo já tem todas as ocorrências carregadas
+        if previous and not engine.narrows(previous, search):
+            return False
+
+        return self.model.narrow(search, lambda row: engine.matches(row, search))
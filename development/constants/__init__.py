@@ -45,3 +45,50 @@ COLORS = [
 ]
 
 LOCALS = ["Sobre pista","Acostamento","Canteiro central","Área de domínio"]
+
+# Problemas oferecidos no formulário, em grupos (título, cor do título, itens)
+PROBLEMS = [
+    ("Mecânicos", "darkgreen", ["Pane Mecânica", "Pane Elétrica"]),
+    (
+        "Acidentes",
+        "#C41111",
+        [
+            "Sinistro / Colisão",
+            "Sinistro / Tombamento",
+            "Sinistro / Capotamento",
+            "Sinistro / Saída de pista",
+        ],
+    ),
+    (
+        "Pneus",
+        "darkorange",
+        [
+            "Pneu furado / Danificado, possui estepe: Sim",
+            "Pneu furado / Danificado, possui estepe: Não",
+        ],
+    ),
+]
+
+# Problemas do formulário simples (sem veículo)
+OTHER_PROBLEMS = [
+    (
+        "Animais Soltos",
+        "#00AC0B",
+        [
+            "Equino solto na via",
+            "Bovino solto na via",
+            "Suíno solto na via",
+            "Canino solto na via",
+        ],
+    ),
+    (
+        "Animais Mortos",
+        "#C41111",
+        [
+            "Equino morto na via",
+            "Bovino morto na via",
+            "Suíno morto na via",
+            "Canino morto na via",
+        ],
+    ),
+]
@@ -1,6 +1,24 @@
 import sqlite3
 from typing import Optional, List, Tuple, Any
 from math import ceil
+from .pool import ConnectionPool, PoolTimeoutError
+from .pragmas import PROFILES, PragmaProfile, get_profile
+from .pagination import Cursor, seek_clause
+from .search import (
+    FullTextSearchEngine,
+    LikeSearchEngine,
+    deferred_index,
+    ensure_index,
+    loaded_engine,
+    search_engine,
+)
+from .counts import count_cache, ensure_counter, read_total
+from .pages import PageCache, page_cache, page_key
+from .schema import bootstrap
+from .migrations import MIGRATIONS, SCHEMA_VERSION, Migration, migrate
+from .rows import COLUMNS, OccurrenceRow, occurrence_row
+from .tracing import QueryStats, QueryTracer, normalize_sql, tracer
+
 
 
 class ResponseSearch:
@@ -10,11 +28,15 @@ class ResponseSearch:
         total_pages: int = None,
         total_rows: int = None,
         data = None,
+        next_cursor: str = None,
+        previous_cursor: str = None,
     ):
         self.page = page
         self.total_pages = total_pages
         self.total_rows = total_rows
         self.data = data
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
 
 
 class SQLiteManager:
@@ -23,101 +45,276 @@ class SQLiteManager:
         self.conn = None
         self.cursor = None
         self.db_path = "app/database/database.db"
+        self.pool = None
 
     def __enter__(self):
-        """Abre a conexão e retorna o próprio objeto para uso com 'with'."""
-        self.conn = sqlite3.connect(self.db_name)
+        """Empresta uma conexão do pool e retorna o próprio objeto para uso com 'with'."""
+        bootstrap(self.db_name)  # Só cria o esquema no primeiro uso do banco
+        # Consultado a cada uso: o pool pode ter sido trocado (outro perfil de PRAGMAs)
+        self.pool = ConnectionPool.instance(self.db_name)
+        self.conn = self.pool.acquire()
         self.cursor = self.conn.cursor()
         return self  # Retorna a própria instância da classe
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Fecha a conexão automaticamente quando sai do bloco 'with'."""
+        """Devolve a conexão ao pool quando sai do bloco 'with'."""
         if self.conn:
-            if exc_type is None:  # Se não houve erro, faz commit
-                self.conn.commit()
-            self.conn.close()
+            self.cursor.close()
+            # Se não houve erro, faz commit (no uso mais externo da conexão)
+            self.pool.release(self.conn, commit=exc_type is None)
+            self.conn = None
+            self.cursor = None
 
     def execute(self, query: str, params: Tuple = ()) -> None:
         """Executa uma query sem retorno (INSERT, UPDATE, DELETE)."""
-        self.cursor.execute(query, params)
+        with tracer.timed(self.conn, query, params) as timing:
+            self.cursor.execute(query, params)
+            timing.rows = max(self.cursor.rowcount, 0)
 
     def fetchone(self, query: str, params: Tuple = ()) -> Tuple[Any]:
         """Executa uma query e retorna um único resultado."""
-        self.cursor.execute(query, params)
-        return self.cursor.fetchone()
+        with tracer.timed(self.conn, query, params) as timing:
+            self.cursor.execute(query, params)
+            row = self.cursor.fetchone()
+            timing.rows = int(row is not None)
+        return row
 
     def fetchall(self, query: str, params: Tuple = ()) -> List[Tuple[Any]]:
         """Executa uma query e retorna todos os resultados."""
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        with tracer.timed(self.conn, query, params) as timing:
+            self.cursor.execute(query, params)
+            rows = self.cursor.fetchall()
+            timing.rows = len(rows)
+        return rows
 
     def create_table(self, table_name: str, columns: str) -> None:
         """Cria uma tabela no banco de dados."""
         query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})"
         self.execute(query)
 
+    def search_engine(self):
+        """Motor de busca do banco (FTS5 quando disponível, senão LIKE)."""
+        return search_engine(self.db_name, self.conn)
+
+    def _search_filter(self, search: Optional[str], engine=None) -> Tuple[str, Tuple]:
+        """Retorna a condição de busca (sem WHERE) e seus parâmetros."""
+        if not search:
+            return "", ()
+        return (engine or self.search_engine()).filter(search)
+
+    def count(self, search: Optional[str] = None, engine=None) -> int:
+        """Total de ocorrências da busca, sem COUNT(*) quando já conhecido.
+
+        Sem busca, lê o contador mantido por gatilhos; com busca, usa o cache
+        de contagens, invalidado pelas escritas de `Occurrence`.
+        """
+        if not search:
+            return read_total(self.conn)
+
+        engine = engine or self.search_engine()
+        key = engine.cache_key(search)
+        cached = count_cache.get(self.db_name, key)
+        if cached is not None:
+            return cached
+
+        version = count_cache.version(self.db_name)
+        query, params = engine.count_query(search)
+        value = self.fetchone(query, params)[0]
+        count_cache.set(self.db_name, key, value, version)
+        return value
+
+    def fetch_rows(self, query: str, params: Tuple = ()) -> List[OccurrenceRow]:
+        """Executa uma consulta que seleciona `COLUMNS` e retorna `OccurrenceRow`s."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = occurrence_row
+        try:
+            with tracer.timed(self.conn, query, params) as timing:
+                rows = cursor.execute(query, params).fetchall()
+                timing.rows = len(rows)
+            return rows
+        finally:
+            cursor.close()
+
+    def _to_occurrences(self, results: List[OccurrenceRow]) -> list:
+        return [row.to_occurrence(self.db_name) for row in results]
+
+    def lookup(
+        self,
+        highway: Optional[str] = None,
+        km_from: Optional[int] = None,
+        km_to: Optional[int] = None,
+        license_plate: Optional[str] = None,
+        phone: Optional[str] = None,
+        limit: int = 50,
+    ) -> list:
+        """Consultas diretas da mesa de despacho, atendidas pelos índices do esquema.
+
+        Rodovia + faixa de km usa `idx_occurrences_highway_km`; placa e telefone
+        usam os seus próprios índices. Os filtros informados são combinados.
+        """
+        conditions, params = [], ()
+
+        if highway is not None:
+            conditions.append("highway = ?")
+            params += (highway,)
+            if km_from is not None:
+                conditions.append("km >= ?")
+                params += (km_from,)
+            if km_to is not None:
+                conditions.append("km <= ?")
+                params += (km_to,)
+        if license_plate is not None:
+            conditions.append("license_plate = ?")
+            params += (license_plate.strip().upper(),)
+        if phone is not None:
+            conditions.append("phone = ?")
+            params += (phone,)
+
+        if not conditions:
+            raise ValueError("Informe ao menos um filtro para a consulta.")
+
+        query = (
+            f"SELECT {', '.join(COLUMNS)} FROM occurrences"
+            f" WHERE {' AND '.join(conditions)} ORDER BY id DESC LIMIT ?"
+        )
+        with SQLiteManager(db_name=self.db_name) as db:
+            results = db.fetch_rows(query, params + (limit,))
+
+        return self._to_occurrences(results)
+
+    def _cached_page(self, key: tuple, load) -> ResponseSearch:
+        """Página do `page_cache`; só consulta o banco (com `load`) em caso de falta."""
+        response = page_cache.get(self.db_name, key)
+        if response is None:
+            version = page_cache.version(self.db_name)
+            response = load()
+            page_cache.set(self.db_name, key, response, version)
+        return response
+
     def searchPagination(
-        self, search: Optional[str] = None, page: int = 1, rows: int = 15
+        self,
+        search: Optional[str] = None,
+        page: int = 1,
+        rows: int = 15,
+        engine=None,
+        compact: bool = False,
+        cache: bool = False,
     ) -> ResponseSearch:
-        offset = (page - 1) * rows
+        """Paginação por OFFSET; com busca no FTS5, ordena os resultados por relevância.
 
-        base_query = """
-        SELECT id, name, phone, highway, km, direction, vehicle, color, license_plate, 
-            problem, occupantes, local, reference_point, observations, is_vehicle
-        FROM occurrences
+        Com `compact=True`, `data` traz `OccurrenceRow`s em vez de `Occurrence`s, e
+        `cache=True` serve a página do `page_cache` quando ela já foi consultada.
         """
+        if cache and compact:
+            return self._cached_page(
+                page_key("offset", search, page, rows),
+                lambda: self.searchPagination(search, page, rows, engine, compact=True),
+            )
+
+        offset = (page - 1) * rows
 
-        count_query = "SELECT COUNT(*) FROM occurrences"
-        params = ()
-
-        if search:
-            filter_clause = """
-            WHERE name LIKE ? 
-            OR phone LIKE ? 
-            OR highway LIKE ? 
-            OR CAST(km AS TEXT) LIKE ? 
-            OR vehicle LIKE ? 
-            OR license_plate LIKE ?
-            """
-            base_query += filter_clause
-            count_query += filter_clause
-            params = ("%" + search + "%",) * 6
-
-        base_query += " ORDER BY id DESC LIMIT ? OFFSET ?"
-        params += (rows, offset)
-
-        with SQLiteManager(db_name=self.db_path) as db:
-            if search:
-                db.execute(count_query, params[:6])
+        base_query = f"SELECT {', '.join(COLUMNS)} FROM occurrences"
+
+        with SQLiteManager(db_name=self.db_name) as db:
+            engine = engine or db.search_engine()
+            ranked = engine.ranked_query(COLUMNS, search) if search and engine.ranked else None
+
+            if ranked:
+                base_query, params = ranked
             else:
-                db.execute(count_query)
-            
-            total_rows = db.cursor.fetchone()[0]
+                filter_clause, params = db._search_filter(search, engine)
+                if filter_clause:
+                    base_query += " WHERE " + filter_clause
+                base_query += " ORDER BY id DESC LIMIT ? OFFSET ?"
 
-            db.execute(base_query, params)
-            results = db.cursor.fetchall()
+            total_rows = db.count(search, engine)
+            results = db.fetch_rows(base_query, params + (rows, offset))
 
         total_pages = ceil(total_rows / rows) if total_rows > 0 else 1
-        from development.utils.occurrence import Occurrence
-        occurrences = [
-            Occurrence(
-                id=row[0],
-                name=row[1],
-                phone=row[2],
-                highway=row[3],
-                km=row[4],
-                direction=row[5],
-                vehicle=row[6],
-                color=row[7],
-                license_plate=row[8],
-                problem=row[9],
-                occupantes=row[10],
-                local=row[11],
-                reference_point=row[12],
-                observations=row[13],
-                is_vehicle=row[14],
+
+        return ResponseSearch(
+            page=page,
+            total_pages=total_pages,
+            total_rows=total_rows,
+            data=results if compact else self._to_occurrences(results),
+        )
+
+    def searchCursor(
+        self,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        rows: int = 15,
+        engine=None,
+        compact: bool = False,
+        cache: bool = False,
+    ) -> ResponseSearch:
+        """Paginação por chave (keyset): busca a página a partir do cursor opaco.
+
+        Diferente de `searchPagination`, não usa OFFSET; cada página parte do
+        último id visto, então a página 500 custa o mesmo que a primeira.
+        Os resultados seguem sempre a ordem do id, mesmo com busca no FTS5.
+        Com `compact=True`, `data` traz `OccurrenceRow`s em vez de `Occurrence`s, e
+        `cache=True` serve a página do `page_cache` quando ela já foi consultada.
+        """
+        if cache and compact:
+            return self._cached_page(
+                page_key("cursor", search, cursor, rows),
+                lambda: self.searchCursor(search, cursor, rows, engine, compact=True),
             )
-            for row in results
-        ]
 
-        return ResponseSearch(page=page,total_pages=total_pages,total_rows=total_rows, data=occurrences)
+        position = Cursor.decode(cursor)
+
+        base_query = f"SELECT {', '.join(COLUMNS)} FROM occurrences"
+
+        with SQLiteManager(db_name=self.db_name) as db:
+            engine = engine or db.search_engine()
+            filter_clause, filter_params = db._search_filter(search, engine)
+            total_rows = db.count(search, engine)
+
+            seek, order, seek_params = seek_clause(position)
+            conditions = [c for c in (filter_clause, seek) if c]
+            query = base_query
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY {order} LIMIT ?"
+            # Uma linha extra indica se existe página além desta
+            results = db.fetch_rows(query, filter_params + seek_params + (rows + 1,))
+
+            if position is not None and position.direction == "previous" and not results:
+                # Registros removidos antes do cursor: volta para o início
+                position = None
+                results = db.fetch_rows(
+                    base_query
+                    + (" WHERE " + filter_clause if filter_clause else "")
+                    + " ORDER BY id DESC LIMIT ?",
+                    filter_params + (rows + 1,),
+                )
+
+        has_more = len(results) > rows
+        results = results[:rows]
+        page = position.page if position else 1
+
+        if position is not None and position.direction == "previous":
+            results.reverse()
+            has_next, has_previous = True, has_more
+            if not has_previous:
+                page = 1
+        else:
+            has_next, has_previous = has_more, position is not None
+
+        next_cursor = previous_cursor = None
+        if results and has_next:
+            next_cursor = Cursor("next", results[-1].id, page + 1).encode()
+        if results and has_previous:
+            previous_cursor = Cursor("previous", results[0].id, max(page - 1, 1)).encode()
+
+        total_pages = ceil(total_rows / rows) if total_rows > 0 else 1
+
+        return ResponseSearch(
+            page=page,
+            total_pages=total_pages,
+            total_rows=total_rows,
+            data=results if compact else self._to_occurrences(results),
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
@@ -0,0 +1,122 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+STATS_TABLE = "occurrences_stats"
+
+COUNTER_SCHEMA = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ai AFTER INSERT ON occurrences BEGIN
+        UPDATE {STATS_TABLE} SET value = value + 1 WHERE name = 'total';
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ad AFTER DELETE ON occurrences BEGIN
+        UPDATE {STATS_TABLE} SET value = value - 1 WHERE name = 'total';
+    END
+    """,
+]
+
+
+def ensure_counter(conn: sqlite3.Connection) -> None:
+    """Cria a tabela de contadores e seus gatilhos, semeando o total atual."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (STATS_TABLE,)
+    ).fetchone()
+    if exists:
+        return
+
+    conn.execute("SAVEPOINT occurrences_counter")
+    try:
+        for statement in COUNTER_SCHEMA:
+            conn.execute(statement)
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO {STATS_TABLE} (name, value)
+            VALUES ('total', (SELECT COUNT(*) FROM occurrences))
+            """
+        )
+        conn.execute("RELEASE occurrences_counter")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK TO occurrences_counter")
+        conn.execute("RELEASE occurrences_counter")
+        raise
+
+
+def read_total(conn: sqlite3.Connection) -> int:
+    """Total de ocorrências lido do contador mantido pelos gatilhos."""
+    try:
+        row = conn.execute(
+            f"SELECT value FROM {STATS_TABLE} WHERE name = 'total'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    if row is None:
+        # Banco sem contador (ainda não inicializado): conta diretamente
+        row = conn.execute("SELECT COUNT(*) FROM occurrences").fetchone()
+    return row[0]
+
+
+class CountCache:
+    """Cache LRU das contagens de busca, por banco e termo normalizado.
+
+    As contagens filtradas não podem ser ajustadas sem reavaliar a busca, então
+    qualquer escrita feita por `Occurrence.save/update/delete` as invalida.
+
+    Como no `PageCache`, quem conta lê `version` antes da consulta e a repassa
+    a `set`: uma contagem feita antes de uma escrita concorrente é descartada.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def version(self, db_name: str) -> int:
+        with self._lock:
+            return self._version(db_name)
+
+    def _version(self, db_name: str) -> int:
+        # Cresce a cada invalidação do banco ou de todos os bancos
+        return self._epoch + self._versions.get(db_name, 0)
+
+    def get(self, db_name: str, key: str) -> Optional[int]:
+        with self._lock:
+            value = self._entries.get((db_name, key))
+            if value is not None:
+                self._entries.move_to_end((db_name, key))
+            return value
+
+    def set(self, db_name: str, key: str, value: int, version: Optional[int] = None) -> bool:
+        """Guarda a contagem; retorna False se o banco foi alterado desde `version`."""
+        with self._lock:
+            if version is not None and version != self._version(db_name):
+                return False
+            self._entries[(db_name, key)] = value
+            self._entries.move_to_end((db_name, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, db_name: Optional[str] = None) -> None:
+        """Descarta as contagens de um banco (ou de todos, se omitido)."""
+        with self._lock:
+            if db_name is None:
+                self._entries.clear()
+                self._epoch += 1
+                return
+            self._versions[db_name] = self._versions.get(db_name, 0) + 1
+            for key in [k for k in self._entries if k[0] == db_name]:
+                del self._entries[key]
+
+
+count_cache = CountCache()
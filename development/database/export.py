@@ -0,0 +1,265 @@
+"""Exportação das ocorrências em CSV ou JSON Lines, lida direto do cursor.
+
+As linhas saem do `sqlite3` em blocos (`fetchmany`) e vão direto para o
+arquivo, então a memória usada não depende do tamanho do histórico.
+
+Uso sem interface:
+
+    python -m development.database.export relatorio.csv --from 2026-01-01 --to 2026-01-31
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterator, Optional, TextIO, Tuple, Union
+
+from .rows import COLUMNS
+
+FORMATS = ("csv", "jsonl")
+
+DateLike = Union[str, date, datetime, None]
+
+
+class ExportReport:
+    """Resumo de uma exportação."""
+
+    def __init__(self, path: Optional[str], format: str):
+        self.path = path
+        self.format = format
+        self.rows = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExportReport(path={self.path!r}, format={self.format!r}, rows={self.rows}, "
+            f"elapsed={self.elapsed:.2f}s, rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+def _parse_date(value: DateLike) -> Union[date, datetime, None]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Data inválida: {value!r} (use AAAA-MM-DD)") from None
+    return value
+
+
+def _date_range(date_from: DateLike, date_to: DateLike) -> Tuple[list, Tuple]:
+    """Condições sobre `created_at`; uma data final sem horário cobre o dia inteiro."""
+    conditions, params = [], ()
+
+    start, end = _parse_date(date_from), _parse_date(date_to)
+    if isinstance(start, datetime):
+        conditions.append("created_at >= ?")
+        params += (start.strftime("%Y-%m-%d %H:%M:%S"),)
+    elif start is not None:
+        conditions.append("created_at >= ?")
+        params += (start.isoformat(),)
+
+    if isinstance(end, datetime):
+        conditions.append("created_at <= ?")
+        params += (end.strftime("%Y-%m-%d %H:%M:%S"),)
+    elif end is not None:
+        conditions.append("created_at < ?")
+        params += ((end + timedelta(days=1)).isoformat(),)
+
+    return conditions, params
+
+
+def export_query(
+    db,
+    search: Optional[str] = None,
+    date_from: DateLike = None,
+    date_to: DateLike = None,
+    highway: Optional[str] = None,
+    km_from: Optional[int] = None,
+    km_to: Optional[int] = None,
+) -> Tuple[str, Tuple]:
+    """Monta a consulta da exportação com o mesmo filtro de busca da tabela.
+
+    `date_from`/`date_to` delimitam `created_at` (inclusive); `highway` e a
+    faixa de km usam `idx_occurrences_highway_km`.
+    """
+    filter_clause, params = db._search_filter(search)
+    conditions = [filter_clause] if filter_clause else []
+
+    dates, date_params = _date_range(date_from, date_to)
+    conditions += dates
+    params += date_params
+    if highway is not None:
+        conditions.append("highway = ?")
+        params += (highway,)
+    if km_from is not None:
+        conditions.append("km >= ?")
+        params += (int(km_from),)
+    if km_to is not None:
+        conditions.append("km <= ?")
+        params += (int(km_to),)
+
+    query = f"SELECT {', '.join(COLUMNS)} FROM occurrences"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query + " ORDER BY id", params
+
+
+def iter_rows(db, query: str, params: Tuple = (), batch_size: int = 1000) -> Iterator[tuple]:
+    """Percorre o resultado em blocos de `batch_size`, sem carregar tudo."""
+    cursor = db.conn.cursor()
+    cursor.arraysize = batch_size
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
+
+
+def write_csv(rows: Iterator[tuple], output: TextIO, delimiter: str = ",") -> int:
+    writer = csv.writer(output, delimiter=delimiter)
+    writer.writerow(COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterator[tuple], output: TextIO) -> int:
+    count = 0
+    for row in rows:
+        record = dict(zip(COLUMNS, row))
+        record["is_vehicle"] = bool(record["is_vehicle"])
+        output.write(json.dumps(record, ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def _format_for(path: Optional[str], format: Optional[str]) -> str:
+    if format is None:
+        extension = os.path.splitext(path or "")[1].lower().lstrip(".")
+        format = "jsonl" if extension in ("jsonl", "ndjson") else "csv"
+    if format not in FORMATS:
+        raise ValueError(f"Formato desconhecido: {format!r} (opções: {', '.join(FORMATS)})")
+    return format
+
+
+def export_occurrences(
+    output: Union[str, TextIO],
+    db_name: str = "app/database/database.db",
+    format: Optional[str] = None,
+    search: Optional[str] = None,
+    date_from: DateLike = None,
+    date_to: DateLike = None,
+    highway: Optional[str] = None,
+    km_from: Optional[int] = None,
+    km_to: Optional[int] = None,
+    batch_size: int = 1000,
+    on_progress: Callable[[int], None] = None,
+) -> ExportReport:
+    """Exporta as ocorrências filtradas para `output` (caminho ou arquivo aberto).
+
+    O formato vem da extensão (`.csv`, `.jsonl`) quando não é informado. Com
+    caminho, a escrita vai para um `.part` que só substitui o destino ao final,
+    então uma exportação interrompida não deixa um relatório pela metade.
+    """
+    from . import SQLiteManager
+
+    path = output if isinstance(output, str) else None
+    report = ExportReport(path, _format_for(path, format))
+    started = time.perf_counter()
+
+    with SQLiteManager(db_name=db_name) as db:
+        query, params = export_query(db, search, date_from, date_to, highway, km_from, km_to)
+        rows = iter_rows(db, query, params, batch_size)
+        if on_progress:
+            rows = _progress(rows, batch_size, on_progress)
+
+        if path is None:
+            report.rows = _write(report.format, rows, output)
+        else:
+            partial = path + ".part"
+            # `utf-8-sig` para o Excel reconhecer a acentuação do CSV
+            encoding = "utf-8-sig" if report.format == "csv" else "utf-8"
+            try:
+                with open(partial, "w", encoding=encoding, newline="") as file:
+                    report.rows = _write(report.format, rows, file)
+                os.replace(partial, path)
+            except BaseException:
+                if os.path.exists(partial):
+                    os.remove(partial)
+                raise
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def _write(format: str, rows: Iterator[tuple], output: TextIO) -> int:
+    return write_csv(rows, output) if format == "csv" else write_jsonl(rows, output)
+
+
+def _progress(rows: Iterator[tuple], every: int, on_progress: Callable[[int], None]):
+    count = 0
+    for row in rows:
+        yield row
+        count += 1
+        if count % every == 0:
+            on_progress(count)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m development.database.export",
+        description="Exporta as ocorrências em CSV ou JSON Lines.",
+    )
+    parser.add_argument("output", help="arquivo de saída (.csv ou .jsonl); '-' para a saída padrão")
+    parser.add_argument("--db", default="app/database/database.db", help="banco de dados")
+    parser.add_argument("--format", choices=FORMATS, help="formato (padrão: pela extensão)")
+    parser.add_argument("--search", help="mesmo filtro da caixa de busca da tabela")
+    parser.add_argument("--from", dest="date_from", help="data inicial (AAAA-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="data final, inclusive (AAAA-MM-DD)")
+    parser.add_argument("--highway", help="rodovia (ex.: 'BR 376')")
+    parser.add_argument("--km-from", type=int, help="km inicial")
+    parser.add_argument("--km-to", type=int, help="km final")
+    args = parser.parse_args(argv)
+
+    try:
+        report = export_occurrences(
+            sys.stdout if args.output == "-" else args.output,
+            db_name=args.db,
+            format=args.format or ("csv" if args.output == "-" else None),
+            search=args.search,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            highway=args.highway,
+            km_from=args.km_from,
+            km_to=args.km_to,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(
+        f"{report.rows} ocorrências exportadas em {report.elapsed:.2f}s "
+        f"({report.rows_per_second:.0f} linhas/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import sqlite3
+from typing import Callable, List
+
+from .search import ensure_index
+from .counts import ensure_counter
+
+OCCURRENCES_TABLE = """
+    CREATE TABLE IF NOT EXISTS occurrences (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        phone TEXT,
+        highway TEXT,
+        km INTEGER,
+        direction TEXT,
+        vehicle TEXT,
+        color TEXT,
+        license_plate TEXT,
+        problem TEXT,
+        occupantes TEXT,
+        local TEXT,
+        reference_point TEXT,
+        observations TEXT,
+        is_vehicle BOOLEAN
+    )
+"""
+
+
+class Migration:
+    """Passo de evolução do esquema; `apply` precisa ser idempotente."""
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        apply: Callable[[str, sqlite3.Connection], None],
+    ):
+        self.version = version
+        self.description = description
+        self.apply = apply
+
+    def __repr__(self):
+        return f"Migration({self.version}, {self.description!r})"
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _base_schema(db_name: str, conn: sqlite3.Connection) -> None:
+    conn.execute(OCCURRENCES_TABLE)
+    ensure_index(db_name, conn)
+    ensure_counter(conn)
+
+
+def _lookup_indexes(db_name: str, conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_occurrences_highway_km ON occurrences (highway, km)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_occurrences_license_plate ON occurrences (license_plate)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_occurrences_phone ON occurrences (phone)")
+
+
+def _created_at(db_name: str, conn: sqlite3.Connection) -> None:
+    # O SQLite não aceita DEFAULT CURRENT_TIMESTAMP em ALTER TABLE; quem
+    # insere (Occurrence.save) preenche a data. Linhas antigas ficam NULL.
+    if "created_at" not in _columns(conn, "occurrences"):
+        conn.execute("ALTER TABLE occurrences ADD COLUMN created_at TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_occurrences_created_at ON occurrences (created_at)"
+    )
+
+
+def _uppercase_plates(db_name: str, conn: sqlite3.Connection) -> None:
+    # `lookup` busca a placa exata pelo índice; linhas antigas podiam estar em minúsculas
+    conn.execute(
+        "UPDATE occurrences SET license_plate = UPPER(TRIM(license_plate))"
+        " WHERE license_plate <> UPPER(TRIM(license_plate))"
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "tabela occurrences, índice FTS5 e contador de linhas", _base_schema),
+    Migration(2, "índices de rodovia/km, placa e telefone", _lookup_indexes),
+    Migration(3, "coluna created_at com índice", _created_at),
+    Migration(4, "placas em maiúsculas", _uppercase_plates),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db_name: str, conn: sqlite3.Connection) -> List[Migration]:
+    """Aplica, em ordem, as migrações com versão acima de `PRAGMA user_version`.
+
+    Cada passo roda em sua própria transação junto com a atualização da versão,
+    então uma falha deixa o banco na última versão completa.
+    """
+    version = current_version(conn)
+    applied = []
+
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+
+        conn.execute("SAVEPOINT migration")
+        try:
+            migration.apply(db_name, conn)
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+            conn.execute("RELEASE migration")
+        except Exception:
+            conn.execute("ROLLBACK TO migration")
+            conn.execute("RELEASE migration")
+            raise
+        applied.append(migration)
+
+    if applied:
+        conn.execute("PRAGMA optimize")
+    return applied
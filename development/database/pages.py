@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class PageCache:
+    """Cache LRU das páginas de busca (`ResponseSearch`), por banco e (busca, posição, linhas).
+
+    Guarda só páginas `compact`, cujas linhas (`OccurrenceRow`) são imutáveis e
+    podem ser entregues a mais de um leitor. Cada página traz o total da busca,
+    então qualquer escrita no banco invalida todas as páginas dele.
+
+    Quem busca no banco lê `version` antes da consulta e a repassa a `set`: uma
+    página consultada antes de uma escrita (prefetch em andamento, por exemplo)
+    é descartada em vez de voltar ao cache com dados velhos.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def version(self, db_name: str) -> int:
+        with self._lock:
+            return self._version(db_name)
+
+    def _version(self, db_name: str) -> int:
+        # Cresce a cada invalidação do banco ou de todos os bancos
+        return self._epoch + self._versions.get(db_name, 0)
+
+    def get(self, db_name: str, key: Hashable):
+        with self._lock:
+            value = self._entries.get((db_name, key))
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end((db_name, key))
+            return value
+
+    def peek(self, db_name: str, key: Hashable):
+        """Como `get`, mas sem contar acerto/erro nem mexer na ordem do LRU."""
+        with self._lock:
+            return self._entries.get((db_name, key))
+
+    def set(self, db_name: str, key: Hashable, value, version: Optional[int] = None) -> bool:
+        """Guarda a página; retorna False se o banco foi alterado desde `version`."""
+        with self._lock:
+            if version is not None and version != self._version(db_name):
+                return False
+            self._entries[(db_name, key)] = value
+            self._entries.move_to_end((db_name, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, db_name: Optional[str] = None) -> None:
+        """Descarta as páginas de um banco (ou de todos, se omitido)."""
+        with self._lock:
+            if db_name is None:
+                self._entries.clear()
+                self._epoch += 1
+                return
+            self._versions[db_name] = self._versions.get(db_name, 0) + 1
+            for key in [k for k in self._entries if k[0] == db_name]:
+                del self._entries[key]
+
+
+def page_key(kind: str, search: Optional[str], position, rows: int) -> tuple:
+    """Chave de uma página: tipo de paginação (`offset`/`cursor`), busca, página ou cursor e linhas."""
+    return (kind, search or None, position, rows)
+
+
+page_cache = PageCache()
@@ -0,0 +1,48 @@
+import base64
+import json
+from typing import Optional, Tuple, Literal
+
+Direction = Literal["next", "previous"]
+
+
+class Cursor:
+    """Posição de paginação por chave (keyset): direção, id de referência e página."""
+
+    def __init__(self, direction: Direction, id: int, page: int):
+        self.direction = direction
+        self.id = id
+        self.page = page
+
+    def encode(self) -> str:
+        """Serializa o cursor em um token opaco, seguro para URLs."""
+        payload = json.dumps(
+            {"d": self.direction, "id": self.id, "p": self.page}, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode(token: Optional[str]) -> Optional["Cursor"]:
+        """Reconstrói um cursor a partir do token; retorna None para o início da lista."""
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            direction = payload["d"]
+            if direction not in ("next", "previous"):
+                raise ValueError(direction)
+            return Cursor(direction, int(payload["id"]), int(payload["p"]))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Cursor de paginação inválido: {token!r}") from e
+
+
+def seek_clause(cursor: Optional[Cursor]) -> Tuple[str, str, Tuple]:
+    """Retorna (condição, ordenação, parâmetros) para buscar a página do cursor.
+
+    A busca usa o índice da chave primária (`id < ?` / `id > ?`), então o custo
+    de qualquer página é o mesmo da primeira.
+    """
+    if cursor is None:
+        return "", "id DESC", ()
+    if cursor.direction == "next":
+        return "id < ?", "id DESC", (cursor.id,)
+    return "id > ?", "id ASC", (cursor.id,)
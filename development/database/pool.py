@@ -0,0 +1,234 @@
+import atexit
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from .pragmas import PragmaProfile, get_profile
+from .tracing import tracer
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Nenhuma conexão ficou disponível dentro do tempo limite do pool."""
+
+
+class _Lease:
+    """Conexão emprestada a uma thread, com contagem de reentrada."""
+
+    def __init__(self, conn: sqlite3.Connection, created_at: float):
+        self.conn = conn
+        self.created_at = created_at
+        self.depth = 0
+        self.traced = False
+
+
+class ConnectionPool:
+    """Pool limitado de conexões SQLite reaproveitadas entre chamadas.
+
+    Cada thread recebe a sua própria conexão enquanto a utiliza; usos aninhados
+    na mesma thread (um `SQLiteManager` dentro de outro) reaproveitam a mesma
+    conexão. Ao ser liberada, a conexão volta para a fila de ociosas e mantém o
+    cache de páginas aquecido para o próximo empréstimo. Toda conexão nova
+    recebe os PRAGMAs do perfil configurado (WAL, cache, mmap...).
+    """
+
+    _pools: Dict[str, "ConnectionPool"] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_name: str,
+        max_connections: int = 4,
+        timeout: float = 5.0,
+        max_lifetime: Optional[float] = 3600.0,
+        health_check_interval: float = 30.0,
+        profile: "str | PragmaProfile | None" = None,
+    ):
+        self.db_name = db_name
+        self.profile = get_profile(profile)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+
+        self._idle: deque = deque()
+        self._opened = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._local = threading.local()
+
+    @classmethod
+    def instance(
+        cls, db_name: str, profile: "str | PragmaProfile | None" = None
+    ) -> "ConnectionPool":
+        """Retorna o pool compartilhado do processo para o banco informado.
+
+        Informar um `profile` diferente do atual fecha o pool existente e cria
+        outro, para que as próximas conexões já nasçam com os novos PRAGMAs.
+        """
+        pool = cls._pools.get(db_name)
+        if pool is not None and not pool._closed:
+            if profile is None or pool.profile is get_profile(profile):
+                return pool
+
+        with cls._pools_lock:
+            pool = cls._pools.get(db_name)
+            if pool is not None and not pool._closed:
+                if profile is None or pool.profile is get_profile(profile):
+                    return pool
+                pool.close()
+            pool = cls(db_name, profile=profile)
+            cls._pools[db_name] = pool
+        return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Fecha todos os pools do processo (chamado automaticamente no encerramento)."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def _connect(self) -> _Lease:
+        conn = sqlite3.connect(
+            self.db_name, timeout=self.timeout, check_same_thread=False
+        )
+        try:
+            self.profile.apply(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return _Lease(conn, time.monotonic())
+
+    def _is_healthy(self, lease: _Lease, idle_since: float) -> bool:
+        now = time.monotonic()
+        if self.max_lifetime is not None and now - lease.created_at > self.max_lifetime:
+            return False
+        if now - idle_since < self.health_check_interval:
+            return True
+        try:
+            lease.conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, lease: _Lease) -> None:
+        try:
+            lease.conn.close()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self) -> sqlite3.Connection:
+        """Empresta uma conexão para a thread atual (reentrante)."""
+        lease: Optional[_Lease] = getattr(self._local, "lease", None)
+        if lease is not None:
+            lease.depth += 1
+            return lease.conn
+
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Pool de conexões já foi fechado.")
+
+                while self._idle:
+                    candidate, idle_since = self._idle.pop()
+                    if self._is_healthy(candidate, idle_since):
+                        lease = candidate
+                        break
+                    self._discard(candidate)
+                    self._opened -= 1
+                if lease is not None:
+                    break
+
+                if self._opened < self.max_connections:
+                    self._opened += 1
+                    try:
+                        lease = self._connect()
+                    except sqlite3.Error:
+                        self._opened -= 1
+                        raise
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise PoolTimeoutError(
+                        f"Nenhuma conexão disponível para {self.db_name} após {self.timeout}s."
+                    )
+
+        if lease.traced is not tracer.enabled:
+            # O rastreamento pode ser ligado ou desligado com o pool em uso
+            lease.conn.set_trace_callback(tracer.on_statement if tracer.enabled else None)
+            lease.traced = tracer.enabled
+
+        lease.depth = 1
+        self._local.lease = lease
+        return lease.conn
+
+    def release(self, conn: sqlite3.Connection, commit: bool = True) -> None:
+        """Devolve a conexão; o commit/rollback acontece ao sair do uso mais externo."""
+        lease: Optional[_Lease] = getattr(self._local, "lease", None)
+        if lease is None or lease.conn is not conn:
+            raise sqlite3.ProgrammingError("Conexão não pertence à thread atual.")
+
+        if not commit and conn.in_transaction:
+            conn.rollback()
+
+        lease.depth -= 1
+        if lease.depth > 0:
+            return
+
+        self._local.lease = None
+        try:
+            if commit and conn.in_transaction:
+                conn.commit()
+        except sqlite3.Error:
+            # Sem o rollback a transação de escrita fica aberta e trava o banco
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            with self._condition:
+                if self._closed or conn.in_transaction:
+                    self._discard(lease)
+                    self._opened -= 1
+                else:
+                    self._idle.append((lease, time.monotonic()))
+                self._condition.notify()
+
+    def checkpoint(self, mode: Optional[str] = None) -> Optional[tuple]:
+        """Executa um checkpoint do WAL usando uma conexão do pool."""
+        conn = self.acquire()
+        try:
+            return self.profile.checkpoint(conn, mode or "passive")
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas; as emprestadas são fechadas ao retornar."""
+        with self._condition:
+            self._closed = True
+            if self._idle:
+                # Política de checkpoint: devolve o WAL ao banco antes de fechar
+                lease, _ = self._idle[-1]
+                try:
+                    self.profile.checkpoint(lease.conn)
+                except sqlite3.Error:
+                    pass
+            while self._idle:
+                lease, _ = self._idle.pop()
+                self._discard(lease)
+                self._opened -= 1
+            self._condition.notify_all()
+
+    @property
+    def size(self) -> int:
+        """Quantidade de conexões abertas (emprestadas + ociosas)."""
+        return self._opened
+
+
+atexit.register(ConnectionPool.close_all)
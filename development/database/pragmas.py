@@ -0,0 +1,104 @@
+import os
+import sqlite3
+from typing import Dict, Optional
+
+
+class PragmaProfile:
+    """Conjunto de PRAGMAs aplicado a cada conexão criada pelo pool.
+
+    `None` em qualquer opção mantém o padrão do SQLite. A política de
+    checkpoint combina o automático (`wal_autocheckpoint`, em páginas) com um
+    checkpoint explícito ao fechar o pool (`checkpoint_on_close`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        journal_mode: Optional[str] = "wal",
+        synchronous: Optional[str] = "normal",
+        cache_size: Optional[int] = -16000,
+        mmap_size: Optional[int] = 64 * 1024 * 1024,
+        temp_store: Optional[str] = "memory",
+        busy_timeout: Optional[int] = 5000,
+        wal_autocheckpoint: Optional[int] = 1000,
+        journal_size_limit: Optional[int] = 16 * 1024 * 1024,
+        checkpoint_on_close: Optional[str] = "truncate",
+    ):
+        self.name = name
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.temp_store = temp_store
+        self.busy_timeout = busy_timeout
+        self.wal_autocheckpoint = wal_autocheckpoint
+        self.journal_size_limit = journal_size_limit
+        self.checkpoint_on_close = checkpoint_on_close
+
+    def __repr__(self):
+        return f"PragmaProfile({self.name!r})"
+
+    def pragmas(self) -> Dict[str, object]:
+        """PRAGMAs do perfil, na ordem de aplicação (sem os mantidos no padrão)."""
+        values = {
+            "busy_timeout": self.busy_timeout,
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+            "temp_store": self.temp_store,
+            "wal_autocheckpoint": self.wal_autocheckpoint,
+            "journal_size_limit": self.journal_size_limit,
+        }
+        return {name: value for name, value in values.items() if value is not None}
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        for name, value in self.pragmas().items():
+            conn.execute(f"PRAGMA {name} = {value}").fetchall()
+
+    def checkpoint(self, conn: sqlite3.Connection, mode: Optional[str] = None) -> Optional[tuple]:
+        """Executa um checkpoint do WAL; retorna (ocupado, páginas no log, páginas copiadas)."""
+        mode = mode or self.checkpoint_on_close
+        if not mode or (self.journal_mode or "").lower() != "wal":
+            return None
+        return conn.execute(f"PRAGMA wal_checkpoint({mode.upper()})").fetchone()
+
+
+PROFILES: Dict[str, PragmaProfile] = {
+    # Padrões do SQLite (journal de rollback, synchronous=FULL), para comparação
+    "default": PragmaProfile(
+        "default",
+        journal_mode=None,
+        synchronous=None,
+        cache_size=None,
+        mmap_size=None,
+        temp_store=None,
+        wal_autocheckpoint=None,
+        journal_size_limit=None,
+        checkpoint_on_close=None,
+    ),
+    # WAL com fsync a cada commit: nenhuma transação confirmada se perde
+    "safe": PragmaProfile(
+        "safe",
+        synchronous="full",
+        cache_size=-8000,
+        mmap_size=0,
+    ),
+    # WAL com synchronous=NORMAL: só o último commit pode se perder numa queda de energia
+    "fast": PragmaProfile("fast"),
+}
+
+DEFAULT_PROFILE = os.environ.get("COI_DB_PROFILE", "fast")
+
+
+def get_profile(profile: "str | PragmaProfile | None" = None) -> PragmaProfile:
+    """Resolve um perfil pelo nome (ou `COI_DB_PROFILE`, quando omitido)."""
+    if isinstance(profile, PragmaProfile):
+        return profile
+    name = profile or DEFAULT_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Perfil de PRAGMAs desconhecido: {name!r} (opções: {', '.join(PROFILES)})"
+        ) from None
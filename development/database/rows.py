@@ -0,0 +1,60 @@
+import sqlite3
+from typing import NamedTuple, Optional
+
+COLUMNS = (
+    "id",
+    "name",
+    "phone",
+    "highway",
+    "km",
+    "direction",
+    "vehicle",
+    "color",
+    "license_plate",
+    "problem",
+    "occupantes",
+    "local",
+    "reference_point",
+    "observations",
+    "is_vehicle",
+    "created_at",
+)
+
+
+class OccurrenceRow(NamedTuple):
+    """Linha somente leitura de `occurrences`, sem `__dict__` nem acesso ao banco.
+
+    Usada para exibir páginas da tabela; `to_occurrence` a promove para uma
+    `Occurrence` completa quando for preciso editar, salvar ou copiar.
+    """
+
+    id: int
+    name: Optional[str]
+    phone: Optional[str]
+    highway: Optional[str]
+    km: Optional[int]
+    direction: Optional[str]
+    vehicle: Optional[str]
+    color: Optional[str]
+    license_plate: Optional[str]
+    problem: Optional[str]
+    occupantes: Optional[str]
+    local: Optional[str]
+    reference_point: Optional[str]
+    observations: Optional[str]
+    is_vehicle: Optional[bool]
+    created_at: Optional[str]
+
+    def to_occurrence(self, db_path: Optional[str] = None):
+        """`Occurrence` com os campos da linha, ligada ao banco de onde ela veio."""
+        from development.utils.occurrence import Occurrence
+
+        occurrence = Occurrence(**self._asdict())
+        if db_path is not None:
+            occurrence.db_path = db_path
+        return occurrence
+
+
+def occurrence_row(cursor: sqlite3.Cursor, row: tuple) -> OccurrenceRow:
+    """`row_factory` do sqlite3 para consultas que selecionam `COLUMNS`."""
+    return OccurrenceRow._make(row)
@@ -0,0 +1,37 @@
+import os
+import threading
+
+from .pool import ConnectionPool
+from .migrations import migrate
+
+_bootstrapped: set = set()
+_lock = threading.Lock()
+
+
+def bootstrap(db_name: str) -> None:
+    """Prepara o banco (diretório e migrações pendentes) uma vez por processo.
+
+    A versão aplicada fica registrada em `PRAGMA user_version`; bancos que já
+    estão na versão atual só têm a versão lida.
+    """
+    if db_name in _bootstrapped:
+        return
+
+    with _lock:
+        if db_name in _bootstrapped:
+            return
+
+        db_dir = os.path.dirname(db_name)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        pool = ConnectionPool.instance(db_name)
+        conn = pool.acquire()
+        try:
+            migrate(db_name, conn)
+        except Exception:
+            pool.release(conn, commit=False)
+            raise
+        pool.release(conn)
+
+        _bootstrapped.add(db_name)
@@ -0,0 +1,280 @@
+import re
+import sqlite3
+import threading
+import unicodedata
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+FTS_TABLE = "occurrences_fts"
+
+# `km` também é indexado para manter a busca por quilômetro que o LIKE oferecia
+FTS_COLUMNS = (
+    "name",
+    "phone",
+    "highway",
+    "km",
+    "vehicle",
+    "license_plate",
+    "problem",
+    "reference_point",
+    "observations",
+)
+
+_columns = ", ".join(FTS_COLUMNS)
+_new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_columns},
+        content='occurrences',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON occurrences BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON occurrences BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns})
+        VALUES ('delete', old.id, {_old_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_columns} ON occurrences BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns})
+        VALUES ('delete', old.id, {_old_values});
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+]
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Colunas comparadas pelo LIKE (km é convertido para texto, como no SQL)
+LIKE_COLUMNS = ("name", "phone", "highway", "km", "vehicle", "license_plate")
+
+# O LIKE do SQLite só ignora maiúsculas/minúsculas no ASCII
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _fold(text: str) -> str:
+    """Normaliza como o tokenizer `unicode61 remove_diacritics 2`."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class LikeSearchEngine:
+    """Busca por `LIKE '%termo%'`: varre a tabela inteira, usada sem FTS5."""
+
+    ranked = False
+
+    def filter(self, search: str) -> Tuple[str, Tuple]:
+        """Retorna a condição de busca (sem WHERE) e seus parâmetros."""
+        filter_clause = """
+            (name LIKE ?
+            OR phone LIKE ?
+            OR highway LIKE ?
+            OR CAST(km AS TEXT) LIKE ?
+            OR vehicle LIKE ?
+            OR license_plate LIKE ?)
+            """
+        return filter_clause, ("%" + search + "%",) * 6
+
+    def count_query(self, search: str) -> Tuple[str, Tuple]:
+        filter_clause, params = self.filter(search)
+        return f"SELECT COUNT(*) FROM occurrences WHERE {filter_clause}", params
+
+    def cache_key(self, search: str) -> str:
+        """Chave de cache da busca; o LIKE depende do texto exato digitado."""
+        return "like:" + search
+
+    def matches(self, row, search: str) -> bool:
+        """Avalia o filtro em uma linha já carregada, com a mesma regra do SQL."""
+        needle = search.translate(_ASCII_LOWER)
+        for column in LIKE_COLUMNS:
+            value = getattr(row, column)
+            if value is not None and needle in str(value).translate(_ASCII_LOWER):
+                return True
+        return False
+
+    def narrows(self, previous: str, search: str) -> bool:
+        """True quando os resultados de `search` estão contidos nos de `previous`."""
+        return previous in search
+
+
+class FullTextSearchEngine:
+    """Busca pelo índice FTS5 `occurrences_fts`, com prefixo e ranking por bm25.
+
+    Cada palavra do termo vira um prefixo (`"abc"*`) e todas precisam
+    aparecer na ocorrência. Termos sem nenhuma palavra (só pontuação)
+    caem na busca por LIKE.
+    """
+
+    ranked = True
+
+    def __init__(self):
+        self._fallback = LikeSearchEngine()
+
+    @staticmethod
+    def match_expression(search: str) -> Optional[str]:
+        """Converte o termo digitado em uma expressão MATCH segura do FTS5."""
+        tokens = _TOKEN.findall(search)
+        if not tokens:
+            return None
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def filter(self, search: str) -> Tuple[str, Tuple]:
+        expression = self.match_expression(search)
+        if expression is None:
+            return self._fallback.filter(search)
+        return (
+            f"id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?)",
+            (expression,),
+        )
+
+    def count_query(self, search: str) -> Tuple[str, Tuple]:
+        expression = self.match_expression(search)
+        if expression is None:
+            return self._fallback.count_query(search)
+        return f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?", (expression,)
+
+    def cache_key(self, search: str) -> str:
+        """Chave de cache da busca: termos que geram a mesma expressão MATCH se igualam."""
+        expression = self.match_expression(search)
+        if expression is None:
+            return self._fallback.cache_key(search)
+        return "fts:" + expression.casefold()
+
+    def matches(self, row, search: str) -> bool:
+        """Avalia o MATCH em uma linha já carregada: toda palavra é prefixo de alguma palavra dela."""
+        tokens = _TOKEN.findall(search)
+        if not tokens:
+            return self._fallback.matches(row, search)
+
+        words = set()
+        for column in FTS_COLUMNS:
+            value = getattr(row, column)
+            if value is not None:
+                words.update(_TOKEN.findall(_fold(str(value))))
+        return all(
+            any(word.startswith(token) for word in words)
+            for token in map(_fold, tokens)
+        )
+
+    def narrows(self, previous: str, search: str) -> bool:
+        """True quando os resultados de `search` estão contidos nos de `previous`.
+
+        Acrescentar texto ao fim do termo só estende o último prefixo ou adiciona
+        palavras, o que restringe o MATCH; trocar entre MATCH e LIKE não.
+        """
+        if self.match_expression(previous) is None:
+            return self.match_expression(search) is None and self._fallback.narrows(previous, search)
+        return search.startswith(previous)
+
+    def ranked_query(self, columns: Tuple[str, ...], search: str) -> Optional[Tuple[str, Tuple]]:
+        """Retorna (consulta ordenada por relevância, parâmetros).
+
+        A consulta termina em `LIMIT ? OFFSET ?`, a serem completados por quem chama.
+        """
+        expression = self.match_expression(search)
+        if expression is None:
+            return None
+        qualified = ", ".join(f"o.{column}" for column in columns)
+        query = f"""
+        SELECT {qualified}
+        FROM {FTS_TABLE}
+        JOIN occurrences o ON o.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH ?
+        ORDER BY {FTS_TABLE}.rank, o.id DESC
+        LIMIT ? OFFSET ?
+        """
+        return query, (expression,)
+
+
+_engines: Dict[str, object] = {}
+_engines_lock = threading.Lock()
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def ensure_index(db_name: str, conn: sqlite3.Connection) -> bool:
+    """Cria o índice FTS5 e os gatilhos de sincronização, se ainda não existirem.
+
+    Retorna False quando o SQLite não foi compilado com FTS5.
+    """
+    with _engines_lock:
+        if not _has_fts(conn):
+            conn.execute("SAVEPOINT fts_index")
+            try:
+                for statement in FTS_SCHEMA:
+                    conn.execute(statement)
+                # Indexa as ocorrências que já existiam antes do índice
+                conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+                conn.execute("RELEASE fts_index")
+            except sqlite3.OperationalError:
+                conn.execute("ROLLBACK TO fts_index")
+                conn.execute("RELEASE fts_index")
+                _engines[db_name] = LikeSearchEngine()
+                return False
+
+        _engines[db_name] = FullTextSearchEngine()
+        return True
+
+
+@contextmanager
+def deferred_index(conn: sqlite3.Connection):
+    """Suspende o gatilho de inserção do FTS durante uma carga em lote.
+
+    As linhas inseridas no bloco são indexadas de uma vez ao final, com um
+    único INSERT ... SELECT, em vez de uma inserção no FTS por linha. Precisa
+    de uma transação aberta. O gatilho volta e as linhas já inseridas são
+    indexadas mesmo se o bloco falhar, pois quem chama pode capturar o erro
+    e fazer commit assim mesmo.
+    """
+    if not conn.in_transaction:
+        raise sqlite3.ProgrammingError("deferred_index precisa de uma transação aberta.")
+    if not _has_fts(conn):
+        yield
+        return
+
+    last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM occurrences").fetchone()[0]
+    conn.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai")
+    try:
+        yield
+    finally:
+        # Após um rollback o DROP já foi desfeito e não há linhas novas a indexar
+        if conn.in_transaction:
+            conn.execute(
+                f"""
+                INSERT INTO {FTS_TABLE}(rowid, {_columns})
+                SELECT id, {_columns} FROM occurrences WHERE id > ?
+                """,
+                (last_id,),
+            )
+        conn.execute(FTS_SCHEMA[1])
+
+
+def loaded_engine(db_name: str):
+    """Motor de busca já resolvido para o banco, sem abrir conexão (None se ainda não houver)."""
+    return _engines.get(db_name)
+
+
+def search_engine(db_name: str, conn: sqlite3.Connection):
+    """Retorna o motor de busca do banco: FTS5 quando o índice existe, senão LIKE."""
+    engine = _engines.get(db_name)
+    if engine is None:
+        with _engines_lock:
+            engine = FullTextSearchEngine() if _has_fts(conn) else LikeSearchEngine()
+            _engines[db_name] = engine
+    return engine
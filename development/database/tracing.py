@@ -0,0 +1,270 @@
+import atexit
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, TextIO, Tuple
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+# Só estes comandos aceitam EXPLAIN QUERY PLAN com os mesmos parâmetros
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Forma canônica da consulta: literais viram `?`, listas viram `(?, ...)`."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _SPACES.sub(" ", sql).strip().rstrip(";")
+    return _LIST.sub("(?, ...)", sql)
+
+
+class QueryStats:
+    """Totais de uma consulta normalizada."""
+
+    __slots__ = ("sql", "calls", "timed", "total", "max", "rows", "slow", "plan")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.timed = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.plan: Optional[List[str]] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.timed * 1000 if self.timed else None,
+            "max_ms": self.max * 1000,
+            "rows": self.rows,
+            "slow": self.slow,
+            "plan": self.plan,
+        }
+
+
+class _Timing:
+    """Bloco cronometrado de um comando; quem consulta preenche `rows`."""
+
+    __slots__ = ("tracer", "conn", "sql", "params", "rows", "steps", "started", "outer")
+
+    def __init__(self, tracer: "QueryTracer", conn, sql: str, params: Tuple):
+        self.tracer = tracer
+        self.conn = conn
+        self.sql = sql
+        self.params = params
+        self.rows = 0
+        self.steps = 0
+
+    def __enter__(self) -> "_Timing":
+        self.outer = getattr(self.tracer._local, "timing", None)
+        self.tracer._local.timing = self
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        elapsed = time.perf_counter() - self.started
+        self.tracer._local.timing = self.outer
+        if exc_type is None:
+            self.tracer._record(self, elapsed)
+
+
+class _Untimed:
+    """Substituto do `_Timing` com o rastreamento desligado."""
+
+    __slots__ = ("rows",)
+
+    def __enter__(self) -> "_Untimed":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+class QueryTracer:
+    """Instrumentação das consultas do `SQLiteManager`.
+
+    Com o rastreamento ligado, cada `execute`/`fetchone`/`fetchall`/`fetch_rows`
+    é cronometrado e somado às estatísticas da sua consulta normalizada (os
+    literais viram `?`), então as variações de `searchPagination` aparecem
+    separadas. Comandos acima de `slow_ms` vão para o log de consultas lentas,
+    com o `EXPLAIN QUERY PLAN` capturado na primeira vez que ficam lentos.
+
+    As conexões do pool recebem um `set_trace_callback`: comandos executados
+    direto na conexão (migrações, importação, exportação) são contados sem
+    tempo, e os comandos internos (gatilhos, tabelas do FTS5) entram em `steps`
+    do comando que os disparou.
+
+    Variáveis de ambiente: `COI_DB_TRACE` liga o rastreamento e imprime o
+    relatório no `stderr` ao sair; `COI_DB_SLOW_MS` muda o limite (padrão: 100)
+    e `COI_DB_SLOW_LOG` grava o log lento (JSON Lines) num arquivo.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        slow_ms: float = 100.0,
+        explain: bool = True,
+        slow_log: Optional[str] = None,
+        max_queries: int = 500,
+    ):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self.slow_log = slow_log
+        self.max_queries = max_queries
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._untimed = _Untimed()
+
+    def configure(self, **options) -> None:
+        """Altera as opções (`enabled`, `slow_ms`, `explain`, `slow_log`, `max_queries`).
+
+        As conexões do pool passam a usar o novo estado no próximo empréstimo.
+        """
+        for name, value in options.items():
+            if not hasattr(self, name) or name.startswith("_"):
+                raise TypeError(f"Opção desconhecida: {name!r}")
+            setattr(self, name, value)
+
+    def timed(self, conn: sqlite3.Connection, sql: str, params: Tuple = ()):
+        """Contexto que cronometra um comando; sem custo com o rastreamento desligado."""
+        if not self.enabled:
+            return self._untimed
+        return _Timing(self, conn, sql, params)
+
+    def on_statement(self, statement: str) -> None:
+        """Callback de `set_trace_callback` das conexões do pool."""
+        if getattr(self._local, "explaining", False):
+            return
+        timing = getattr(self._local, "timing", None)
+        if timing is not None:
+            timing.steps += 1
+            return
+        stats = self._entry(normalize_sql(statement))
+        if stats is not None:
+            with self._lock:
+                stats.calls += 1
+
+    def _entry(self, key: str) -> Optional[QueryStats]:
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.get(key)
+                if stats is None:
+                    # Consultas montadas com valores no texto não podem crescer sem limite
+                    if len(self._stats) >= self.max_queries:
+                        return None
+                    stats = self._stats[key] = QueryStats(key)
+        return stats
+
+    def _record(self, timing: _Timing, elapsed: float) -> None:
+        key = normalize_sql(timing.sql)
+        stats = self._entry(key)
+        slow = elapsed * 1000 >= self.slow_ms
+
+        if stats is not None:
+            with self._lock:
+                stats.calls += 1
+                stats.timed += 1
+                stats.total += elapsed
+                stats.max = max(stats.max, elapsed)
+                stats.rows += timing.rows or 0
+                stats.slow += slow
+
+        if slow:
+            plan = stats.plan if stats is not None else None
+            if plan is None and self.explain:
+                plan = self.explain_plan(timing.conn, timing.sql, timing.params)
+                if stats is not None:
+                    stats.plan = plan
+            self._log_slow(key, elapsed, timing, plan)
+
+    def explain_plan(self, conn: sqlite3.Connection, sql: str, params: Tuple = ()) -> Optional[List[str]]:
+        """`EXPLAIN QUERY PLAN` do comando, indentado pela árvore do plano."""
+        if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        self._local.explaining = True
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except sqlite3.Error as e:
+            return [f"(plano indisponível: {e})"]
+        finally:
+            self._local.explaining = False
+
+        depth = {0: -1}
+        plan = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, -1) + 1
+            plan.append("  " * depth[node] + detail)
+        return plan
+
+    def _log_slow(self, sql: str, elapsed: float, timing: _Timing, plan: Optional[List[str]]) -> None:
+        # Sem os parâmetros: são nomes, telefones e placas de quem ligou
+        entry = {
+            "at": datetime.now().isoformat(timespec="milliseconds"),
+            "ms": round(elapsed * 1000, 3),
+            "sql": sql,
+            "rows": timing.rows,
+            "steps": timing.steps,
+            "thread": threading.current_thread().name,
+            "plan": plan,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self.slow_log:
+                with open(self.slow_log, "a", encoding="utf-8") as file:
+                    file.write(line + "\n")
+            else:
+                print(f"[consulta lenta] {line}", file=sys.stderr)
+
+    def snapshot(self) -> List[dict]:
+        """Estatísticas por consulta normalizada, da que mais consumiu tempo para a que menos."""
+        with self._lock:
+            stats = [entry.to_dict() for entry in self._stats.values()]
+        return sorted(stats, key=lambda entry: (entry["total_ms"], entry["calls"]), reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, limit: int = 20, output: TextIO = None) -> None:
+        output = output or sys.stderr
+        stats = self.snapshot()
+        print(f"Consultas ({len(stats)} distintas, limite lento {self.slow_ms:g} ms):", file=output)
+        for entry in stats[:limit]:
+            mean = f"{entry['mean_ms']:8.3f}" if entry["mean_ms"] is not None else "       -"
+            print(
+                f"  {entry['calls']:>7}x  total {entry['total_ms']:9.1f} ms  média {mean} ms  "
+                f"máx {entry['max_ms']:8.1f} ms  lentas {entry['slow']:>4}  {entry['sql'][:120]}",
+                file=output,
+            )
+
+
+def _from_environment() -> QueryTracer:
+    enabled = bool(os.environ.get("COI_DB_TRACE"))
+    tracer = QueryTracer(
+        enabled=enabled,
+        slow_ms=float(os.environ.get("COI_DB_SLOW_MS") or 100),
+        slow_log=os.environ.get("COI_DB_SLOW_LOG") or None,
+    )
+    if enabled:
+        atexit.register(tracer.report)
+    return tracer
+
+
+tracer = _from_environment()
@@ -2,11 +2,14 @@ from .custom_tooltip import CTooltip
 from .custom_frame import CFrame
 from .custom_layout import CLayout
 from .custom_toggle_theme import ToggleTheme
+from .custom_filter import TextFilter, FilterValidator, build_filter
 from .custom_input import CInput
 from .custom_button import CButton
+from .custom_button_delegate import CButtonDelegate
 from .custom_text_area import CTextArea
 from .custom_switch import CSwitch
 from .custom_messagebox import CMessageBox, ButtonRole
 from .custom_table import CTable
 from .custom_label import CLabel
-from .custom_select import CSelect
\ No newline at end of file
+from .custom_select import CSelect
+from .custom_table_view import CTableView
\ No newline at end of file
@@ -156,5 +156,5 @@ class CButton(QPushButton, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
         self.update()
@@ -0,0 +1,76 @@
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
+from PySide6.QtGui import QPixmap, QPainter, QColor, QMouseEvent
+from PySide6.QtCore import QSize, Qt, QModelIndex, QEvent, QAbstractItemModel, QRect
+from development.styles import rgba, icon_cache
+
+
+class CButtonDelegate(QStyledItemDelegate):
+    """Botão de ícone desenhado pela própria tabela, sem widget por linha.
+
+    O ícone vem do `icon_cache` e é reaproveitado por todas as células;
+    o clique é tratado em `editorEvent` e repassado para `onClick(index)`.
+    """
+
+    def __init__(
+        self,
+        icon_path: str,
+        icon_size: QSize = QSize(20, 20),
+        bg_color: rgba = None,
+        hover_bg_color: rgba = None,
+        onClick: callable = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._icon_path = icon_path
+        self._icon_size = icon_size
+        self._bg_color = bg_color
+        self._hover_bg_color = hover_bg_color
+        self.onClick = onClick
+
+    def pixmap(self, device_pixel_ratio: float = 1.0) -> QPixmap:
+        return icon_cache.pixmap(self._icon_path, self._icon_size, device_pixel_ratio)
+
+    def setColors(self, bg_color: rgba = None, hover_bg_color: rgba = None):
+        self._bg_color = bg_color
+        self._hover_bg_color = hover_bg_color
+
+    @staticmethod
+    def __qcolor(color) -> QColor:
+        if isinstance(color, rgba):
+            return color.to_qcolor()
+        return QColor(str(color))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        color = self._hover_bg_color if hovered and self._hover_bg_color else self._bg_color
+
+        painter.save()
+        if color is not None:
+            painter.fillRect(option.rect, self.__qcolor(color))
+
+        device_pixel_ratio = painter.device().devicePixelRatioF()
+        rect = QRect(0, 0, self._icon_size.width(), self._icon_size.height())
+        rect.moveCenter(option.rect.center())
+        painter.drawPixmap(rect, self.pixmap(device_pixel_ratio))
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return self._icon_size + QSize(16, 10)
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> bool:
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and isinstance(event, QMouseEvent)
+            and event.button() == Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            if self.onClick:
+                self.onClick(index)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,82 @@
+import re
+from functools import lru_cache
+from typing import Callable, Tuple
+
+from PySide6.QtGui import QValidator
+
+_NON_DIGITS = re.compile(r"\D")
+_SPECIAL_CHARS = re.compile(r"[^a-zA-Z0-9 ]")
+
+
+def only_numbers(text: str) -> str:
+    return _NON_DIGITS.sub("", text)
+
+
+def no_special_chars(text: str) -> str:
+    return _SPECIAL_CHARS.sub("", text)
+
+
+def only_uppercase(text: str) -> str:
+    return text.upper()
+
+
+class TextFilter:
+    """Cadeia de filtros de texto aplicada em ordem, com padrões pré-compilados.
+
+    Os filtros atuam caractere a caractere (removem ou trocam cada caractere sem
+    olhar os vizinhos), então filtrar só o trecho inserido dá o mesmo resultado
+    que filtrar o texto inteiro.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self, *steps: Callable[[str], str]):
+        self.steps: Tuple[Callable[[str], str], ...] = steps
+
+    def __call__(self, text: str) -> str:
+        for step in self.steps:
+            text = step(text)
+        return text
+
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+
+    def then(self, *steps: "Callable[[str], str] | TextFilter") -> "TextFilter":
+        """Nova cadeia com os passos (ou cadeias) informados ao final."""
+        extra = []
+        for step in steps:
+            extra.extend(step.steps if isinstance(step, TextFilter) else (step,))
+        return TextFilter(*self.steps, *extra)
+
+
+@lru_cache(maxsize=None)
+def build_filter(
+    numbers: bool = False, no_special: bool = False, uppercase: bool = False
+) -> TextFilter:
+    """Cadeia compartilhada para a combinação de opções dos campos (`only_numbers`...)."""
+    steps = []
+    if numbers:
+        steps.append(only_numbers)
+    if no_special:
+        steps.append(no_special_chars)
+    if uppercase:
+        steps.append(only_uppercase)
+    return TextFilter(*steps)
+
+
+class FilterValidator(QValidator):
+    """Aplica um `TextFilter` ao que é digitado em um `QLineEdit` (ou `QComboBox` editável)."""
+
+    def __init__(self, text_filter: TextFilter, parent=None):
+        super().__init__(parent)
+        self.text_filter = text_filter
+
+    def validate(self, text: str, pos: int):
+        filtered = self.text_filter(text)
+        if filtered != text:
+            # Mantém o cursor após o que sobrou do trecho à esquerda dele
+            pos = len(self.text_filter(text[:pos]))
+        return QValidator.State.Acceptable, filtered, pos
+
+    def fixup(self, text: str) -> str:
+        return self.text_filter(text)
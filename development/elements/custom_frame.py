@@ -139,6 +139,6 @@ class CFrame(QFrame, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet)
         self.update()
 
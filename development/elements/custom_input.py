@@ -1,11 +1,10 @@
 from PySide6.QtWidgets import QLineEdit, QLabel, QVBoxLayout, QHBoxLayout, QWidget, QCompleter
-from PySide6.QtGui import QPixmap, QPainter, QFont
+from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
-from PySide6.QtSvg import QSvgRenderer
-from development.styles import Colors, Border, type_border, Padding, BorderRadius
+from development.styles import Colors, Border, type_border, Padding, BorderRadius, icon_cache
 from development.elements import CTooltip
 from development.model import Instances
-import re
+from .custom_filter import FilterValidator, build_filter
 
 
 class CInput(QWidget, Instances):
@@ -66,6 +65,7 @@ class CInput(QWidget, Instances):
         self.no_special_chars = no_special_chars
         self.only_uppercase = only_uppercase
         self.value = value
+        self.text_filter = None
 
         self.completer = QCompleter(self.suggestions, self)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
@@ -89,8 +89,8 @@ class CInput(QWidget, Instances):
 
         if self.value is not None:
             self.input_field.setText(str(self.value))
-    
-        self.input_field.textChanged.connect(self.__on_text_changed)
+
+        self.__update_filter()
         self.input_field.setFont(QFont("Arial", self._font_size))
 
     def __setup__(self):
@@ -133,22 +133,17 @@ class CInput(QWidget, Instances):
 
         self.setLayout(main_layout)
 
-    def __on_text_changed(self, text: str):
-        cursor_pos = self.input_field.cursorPosition()
-        filtered_text = self.apply_filters(text)
-        
-        if filtered_text != text:
-            self.input_field.setText(filtered_text)
-            self.input_field.setCursorPosition(cursor_pos - (len(text) - len(filtered_text)))
+    def __update_filter(self):
+        # O filtro roda no validador do QLineEdit, antes de o texto mudar
+        self.text_filter = build_filter(
+            self.only_numbers, self.no_special_chars, self.only_uppercase
+        )
+        self.input_field.setValidator(
+            FilterValidator(self.text_filter, self) if self.text_filter else None
+        )
 
     def apply_filters(self, text: str) -> str:
-        if self.only_numbers:
-            text = re.sub(r'\D', '', text)
-        if self.no_special_chars:
-            text = re.sub(r'[^a-zA-Z0-9 ]', '', text)
-        if self.only_uppercase:
-            text = text.upper()
-        return text
+        return self.text_filter(text)
     
     def clear(self):
         self.input_field.clear()
@@ -233,35 +228,23 @@ class CInput(QWidget, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
-        self.input_field.setStyleSheet(style_sheet)
-        self.label.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet, self, self.input_field, self.label)
         self.update()
 
     def setIcon(self, icon_path):
-            if icon_path.lower().endswith(".svg"):
-                # Renderiza SVG com alta qualidade
-                svg_renderer = QSvgRenderer(icon_path)
-                pixmap = QPixmap(20, 20)  # Aumenta o tamanho para melhor resolução
-                pixmap.fill(Qt.transparent)  # Fundo transparente
-                
-                painter = QPainter(pixmap)
-                svg_renderer.render(painter)
-                painter.end()
-            else:
-                # Renderiza imagens comuns com suavização
-                pixmap = QPixmap(icon_path).scaled(
-                    20, 20, mode=Qt.SmoothTransformation
-                )
-            
-            pixmap.setDevicePixelRatio(self.devicePixelRatioF())  # Ajusta para telas de alta DPI
-            self.icon_label.setPixmap(pixmap)
+        # Rasterizado uma vez por processo e já na densidade da tela (alta DPI)
+        self.icon_label.setPixmap(
+            icon_cache.pixmap(icon_path, (20, 20), self.devicePixelRatioF())
+        )
 
     def setOnlyNumbers(self, role: bool):
         self.only_numbers = role
+        self.__update_filter()
 
     def setNoSpecialChars(self, role: bool):
         self.no_special_chars = role
+        self.__update_filter()
 
     def setOnlyUppercase(self, role: bool):
         self.only_uppercase = role
+        self.__update_filter()
@@ -1,8 +1,6 @@
 from PySide6.QtWidgets import QLabel, QHBoxLayout, QWidget
-from PySide6.QtGui import QPixmap, QPainter
 from PySide6.QtCore import Qt
-from PySide6.QtSvg import QSvgRenderer
-from development.styles import Colors, Border, type_border, Padding, BorderRadius
+from development.styles import Colors, Border, type_border, Padding, BorderRadius, icon_cache
 from development.elements import CTooltip
 from development.model import Instances
 
@@ -82,19 +80,9 @@ class CLabel(QWidget, Instances):
             self.setMaximumSize(self._maximumWidth, self._maximumHeight)
 
     def setIcon(self, icon_path):
-        if icon_path.lower().endswith(".svg"):
-            svg_renderer = QSvgRenderer(icon_path)
-            pixmap = QPixmap(self._icon_size[0], self._icon_size[1])
-            pixmap.fill(Qt.transparent)
-
-            painter = QPainter(pixmap)
-            svg_renderer.render(painter)
-            painter.end()
-        else:
-            pixmap = QPixmap(icon_path).scaled(self._icon_size[0], self._icon_size[1], mode=Qt.SmoothTransformation)
-
-        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
-        self.icon_label.setPixmap(pixmap)
+        self.icon_label.setPixmap(
+            icon_cache.pixmap(icon_path, self._icon_size, self.devicePixelRatioF())
+        )
 
     def __style__(self):
         self.update_styles()
@@ -140,6 +128,5 @@ class CLabel(QWidget, Instances):
             {border_radius}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
-        self.label.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet, self, self.label)
         self.update()
@@ -1,11 +1,9 @@
 from PySide6.QtWidgets import QComboBox, QLabel, QVBoxLayout, QHBoxLayout, QWidget
-from PySide6.QtGui import QPixmap, QPainter, QFont
-from PySide6.QtCore import Qt
-from PySide6.QtSvg import QSvgRenderer
-from development.styles import Colors, Border, type_border, Padding, BorderRadius
+from PySide6.QtGui import QFont
+from development.styles import Colors, Border, type_border, Padding, BorderRadius, icon_cache
 from development.elements import CTooltip
 from development.model import Instances
-import re
+from .custom_filter import FilterValidator, build_filter
 
 
 class CSelect(QWidget, Instances):
@@ -72,6 +70,7 @@ class CSelect(QWidget, Instances):
         self.only_numbers = only_numbers
         self.no_special_chars = no_special_chars
         self.only_uppercase = only_uppercase
+        self.__update_filter()
 
         if items:
             self.combo_box.addItems([self.apply_filters(item) for item in items])
@@ -86,7 +85,6 @@ class CSelect(QWidget, Instances):
         if not (self.default_value):
             self.combo_box.setCurrentIndex(-1)
 
-        self.combo_box.editTextChanged.connect(self.on_text_changed)
         self.combo_box.setFont(QFont("Arial", self._font_size))
 
         self._toolTip = CTooltip(
@@ -261,52 +259,37 @@ class CSelect(QWidget, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
-        self.combo_box.setStyleSheet(style_sheet)
-        self.label.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet, self, self.combo_box, self.label)
         self.update()
 
     def setIcon(self, icon_path):
-        if icon_path.lower().endswith(".svg"):
-            svg_renderer = QSvgRenderer(icon_path)
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(Qt.transparent)
-
-            painter = QPainter(pixmap)
-            svg_renderer.render(painter)
-            painter.end()
-        else:
-            pixmap = QPixmap(icon_path).scaled(20, 20, mode=Qt.SmoothTransformation)
-
-        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
-        self.icon_label.setPixmap(pixmap)
+        self.icon_label.setPixmap(
+            icon_cache.pixmap(icon_path, (20, 20), self.devicePixelRatioF())
+        )
 
     def clearText(self):
         self.combo_box.setCurrentIndex(-1)
 
+    def __update_filter(self):
+        self.text_filter = build_filter(
+            self.only_numbers, self.no_special_chars, self.only_uppercase
+        )
+        if self.combo_box.isEditable():
+            self.combo_box.setValidator(
+                FilterValidator(self.text_filter, self) if self.text_filter else None
+            )
+
     def apply_filters(self, text: str) -> str:
-        if self.only_numbers:
-            text = re.sub(r'\D', '', text)
-        if self.no_special_chars:
-            text = re.sub(r'[^a-zA-Z0-9 ]', '', text)
-        if self.only_uppercase:
-            text = text.upper()
-        return text
+        return self.text_filter(text)
 
     def setOnlyNumbers(self, role: bool):
         self.only_numbers = role
+        self.__update_filter()
 
     def setNoSpecialChars(self, role: bool):
         self.no_special_chars = role
+        self.__update_filter()
 
     def setOnlyUppercase(self, role: bool):
         self.only_uppercase = role
-
-    def on_text_changed(self, text: str):
-        cursor_position = self.combo_box.lineEdit().cursorPosition()
-        filtered_text = self.apply_filters(text)
-
-        self.combo_box.blockSignals(True)
-        self.combo_box.setEditText(filtered_text)
-        self.combo_box.lineEdit().setCursorPosition(cursor_position)
-        self.combo_box.blockSignals(False)    
\ No newline at end of file
+        self.__update_filter()    
\ No newline at end of file
@@ -6,12 +6,12 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QVBoxLayout,
 )
-from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtCore import QSize, Qt
-from development.styles import Colors, Border, BorderRadius, type_border, rgba
+from development.styles import Colors, Border, BorderRadius, type_border, rgba, icon_cache
 from development.elements import CTooltip
 from development.model import Instances
 from .custom_button import CButton
+from .custom_button_delegate import CButtonDelegate
 from .custom_messagebox import CMessageBox
 
 
@@ -94,9 +94,17 @@ class CTable(QTableWidget, Instances):
 
         self.itemDoubleClicked.connect(self.clipboard_row)
 
-        self._cell_bg_color = rgba(
-            r=self._bg_color.r**0.95, g=self._bg_color.g**0.95, b=self._bg_color.b**0.95
+        self._cell_bg_color = self._hover_bg_color or self._bg_color.shade()
+        self._edit_delegate = CButtonDelegate(
+            icon_path="app/icons/svg/lapis.svg",
+            icon_size=QSize(20, 20),
+            bg_color=self._bg_color,
+            hover_bg_color=self._cell_bg_color,
+            onClick=self.__on_edit,
+            parent=self,
         )
+        self._edit_column = None
+        self.setMouseTracking(True)
 
         self.__setup__()
 
@@ -156,7 +164,9 @@ class CTable(QTableWidget, Instances):
         self.btn_update.setToolTip("Atualizar")
 
         icon_path = "app/icons/svg/update.svg"
-        self.btn_update.setIcon(QIcon(icon_path))
+        self.btn_update.setIcon(
+            icon_cache.icon(icon_path, QSize(18, 18), self.devicePixelRatioF())
+        )
         self.btn_update.setIconSize(QSize(18, 18))
 
         self.btn_update._toolTip.bg_color = "#009C00"
@@ -223,22 +233,16 @@ class CTable(QTableWidget, Instances):
             {border_radius}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
-        self.header.setStyleSheet(
-            f"background-color: {self._bg_color}; color: {self._text_color};"
-        )
-        self.header_vertical.setStyleSheet(
-            f"background-color: {self._bg_color}; color: {self._text_color};"
-        )
-        self._cell_bg_color = rgba(
-            r=self._bg_color.r**0.95, g=self._bg_color.g**0.95, b=self._bg_color.b**0.95
+        self.applyStyleSheet(style_sheet)
+        self.applyStyleSheet(
+            f"background-color: {self._bg_color}; color: {self._text_color};",
+            self.header,
+            self.header_vertical,
         )
-        for row in range(self.rowCount()):
-            cell_widget = self.cellWidget(row, self.columnCount() - 1)
-            if isinstance(cell_widget, CButton):
-                cell_widget._bg_color = self._bg_color
-                cell_widget._hover_bg_color = self._cell_bg_color
-                cell_widget.update_styles()
+        self._cell_bg_color = self._hover_bg_color or self._bg_color.shade()
+        # O botão de edição é pintado pelo delegate: basta trocar as cores e repintar
+        self._edit_delegate.setColors(self._bg_color, self._cell_bg_color)
+        self.viewport().update()
 
     def set_headers(self, headers: list[str]):
         self.setColumnCount(len(headers))
@@ -253,17 +257,18 @@ class CTable(QTableWidget, Instances):
             item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.setItem(row_position, col, item)
 
-        edit_button = CButton(
-            text="",
-            bg_color=self._bg_color,
-            hover_bg_color=self._cell_bg_color,
-            border_radius=BorderRadius(all=0),
-            onClick=lambda: self.edit_action(row_data[0]),
-        )
-        edit_button._toolTip.bg_color = Colors.white
-        edit_button.setToolTip(f"ID: {row_data[0]}")
-        icon_path = "app/icons/svg/lapis.svg"
-        edit_button.setIcon(QIcon(QPixmap(icon_path)))
-        edit_button.setIconSize(QSize(20, 20))
-
-        self.setCellWidget(row_position, len(row_data), edit_button)
+        edit_column = len(row_data)
+        if self._edit_column != edit_column:
+            if self._edit_column is not None:
+                self.setItemDelegateForColumn(self._edit_column, None)
+            self.setItemDelegateForColumn(edit_column, self._edit_delegate)
+            self._edit_column = edit_column
+
+        edit_item = QTableWidgetItem()
+        edit_item.setToolTip(f"ID: {row_data[0]}")
+        edit_item.setData(Qt.UserRole, row_data[0])
+        self.setItem(row_position, edit_column, edit_item)
+
+    def __on_edit(self, index):
+        if self.edit_action:
+            self.edit_action(index.data(Qt.UserRole))
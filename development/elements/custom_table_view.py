@@ -0,0 +1,234 @@
+from PySide6.QtWidgets import (
+    QTableView,
+    QHeaderView,
+    QApplication,
+    QHBoxLayout,
+    QVBoxLayout,
+    QAbstractItemView,
+)
+from PySide6.QtCore import QSize, Qt, QModelIndex, QAbstractTableModel
+from development.styles import Colors, Border, BorderRadius, type_border, rgba, icon_cache
+from development.elements import CTooltip
+from development.model import Instances
+from .custom_button import CButton
+from .custom_button_delegate import CButtonDelegate
+from .custom_messagebox import CMessageBox
+
+
+class CTableView(QTableView, Instances):
+    """Tabela model/view: as linhas vêm do modelo e a coluna de ação é desenhada por delegate."""
+
+    def __init__(
+        self,
+        model: QAbstractTableModel,
+        objectName: str = "CTableView",
+        action_column: int = None,
+        width: int = None,
+        height: int = None,
+        minimumWidth: int = None,
+        minimumHeight: int = None,
+        maximumWidth: int = 4096,
+        maximumHeight: int = 2160,
+        bg_color: rgba = Colors.white,
+        border: Border = None,
+        border_radius: BorderRadius = None,
+        text_color: Colors = Colors.black.adjust_tonality(75),
+        vertical: bool = True,
+        horizontal: bool = True,
+        fg_color: rgba = Colors.gray.adjust_tonality(70),
+        hover_bg_color: rgba = None,
+        edit_action: callable = None,
+        update_data: callable = None,
+        export_data: callable = None,
+    ):
+        QTableView.__init__(self)
+        Instances.__init__(
+            self,
+            objectName=objectName,
+            width=width,
+            height=height,
+            minimumWidth=minimumWidth,
+            minimumHeight=minimumHeight,
+            maximumWidth=maximumWidth,
+            maximumHeight=maximumHeight,
+            bg_color=bg_color,
+            border=border,
+            border_radius=border_radius,
+            text_color=text_color,
+            hover_bg_color=hover_bg_color,
+        )
+        self.edit_action = edit_action
+        self.update_data = update_data
+        self.export_data = export_data
+        self._fg_color = fg_color
+        self._toolTip = CTooltip(
+            bg_color=self._bg_color,
+            color=self._text_color,
+            border=Border(
+                pixel=1, type_border=type_border.solid, color=self._text_color
+            ),
+            border_radius=3,
+            padding=5,
+            font_size=12,
+        )
+
+        self.setModel(model)
+        self.action_column = (
+            action_column if action_column is not None else model.columnCount() - 1
+        )
+
+        self.header = self.horizontalHeader()
+        self.header.setHidden(not horizontal)
+        self.header.setSectionResizeMode(QHeaderView.Stretch)
+        self.header.setStretchLastSection(True)
+
+        self.header_vertical = self.verticalHeader()
+        self.header_vertical.setHidden(not vertical)
+
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectItems)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        self._edit_delegate = CButtonDelegate(
+            icon_path="app/icons/svg/lapis.svg",
+            icon_size=QSize(20, 20),
+            onClick=self.__on_edit,
+            parent=self,
+        )
+        self.setItemDelegateForColumn(self.action_column, self._edit_delegate)
+        self.setMouseTracking(True)
+
+        self.doubleClicked.connect(self.clipboard_cell)
+
+        self.__setup__()
+
+    def __setup__(self):
+        self.__config__()
+        self.__style__()
+        self.__ui__()
+
+    def __config__(self):
+        self.setObjectName(self._objectName)
+
+        if self._width is not None and self._height is not None:
+            self.resize(self._width, self._height)
+
+        if self._minimumWidth is not None and self._minimumHeight is not None:
+            self.setMinimumSize(self._minimumWidth, self._minimumHeight)
+
+        if self._maximumWidth is not None and self._maximumHeight is not None:
+            self.setMaximumSize(self._maximumWidth, self._maximumHeight)
+
+    def __style__(self):
+        self.update_styles()
+
+    def __ui__(self):
+        self.btn_update = CButton(
+            text="",
+            onClick=self.update_data,
+            bg_color="#AEFFAE",
+            text_color=Colors.white,
+            hover_bg_color="#94FF94",
+            border_radius=BorderRadius(all=16),
+            minimumWidth=30,
+            minimumHeight=30,
+        )
+        self.btn_update.setToolTip("Atualizar")
+
+        icon_path = "app/icons/svg/update.svg"
+        self.btn_update.setIcon(
+            icon_cache.icon(icon_path, QSize(18, 18), self.devicePixelRatioF())
+        )
+        self.btn_update.setIconSize(QSize(18, 18))
+
+        self.btn_update._toolTip.bg_color = "#009C00"
+        self.btn_update.update_styles()
+
+        self.btn_export = CButton(
+            text="",
+            onClick=self.export_data,
+            bg_color="#AED6FF",
+            text_color=Colors.white,
+            hover_bg_color="#94C9FF",
+            border_radius=BorderRadius(all=16),
+            minimumWidth=30,
+            minimumHeight=30,
+        )
+        self.btn_export.setToolTip("Exportar")
+        self.btn_export.setIcon(
+            icon_cache.icon("app/icons/svg/export.svg", QSize(18, 18), self.devicePixelRatioF())
+        )
+        self.btn_export.setIconSize(QSize(18, 18))
+        self.btn_export._toolTip.bg_color = "#005A9C"
+        self.btn_export.update_styles()
+        self.btn_export.setVisible(self.export_data is not None)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.btn_export)
+        btn_layout.addWidget(self.btn_update)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addStretch()
+        main_layout.addLayout(btn_layout)
+
+        self.setLayout(main_layout)
+
+    def __on_edit(self, index: QModelIndex):
+        if self.edit_action:
+            row = index.data(Qt.UserRole)
+            self.edit_action(row.id)
+
+    def clipboard_cell(self, index: QModelIndex):
+        if index.column() == self.action_column:
+            return
+
+        cell_value = index.data()
+
+        if cell_value is not None and cell_value != "N/A" and cell_value != "":
+            clipboard = QApplication.clipboard()
+            clipboard.setText(cell_value)
+
+            message = CMessageBox(
+                self,
+                title="Notificação",
+                text=f"Valor: [{cell_value}] copiado para área de transferência.",
+            )
+            message.show()
+
+    def update_styles(self):
+        border_radius = (
+            f"""
+            #{self._objectName} {{
+                border-top-left-radius: {self._border_radius.top_left};
+                border-top-right-radius: {self._border_radius.top_right};
+                border-bottom-left-radius: {self._border_radius.bottom_left};
+                border-bottom-right-radius: {self._border_radius.bottom_right};
+            }}
+        """
+            if self._border_radius
+            else ""
+        )
+        style_sheet = f"""
+            #{self._objectName} {{
+                color: {self._text_color};
+                background-color: {self._bg_color};
+                border: {self._border if self._border else 'none'};
+            }}
+            QTableView::item:selected {{
+                background-color: {self._fg_color};
+            }}
+            QHeaderView::section {{
+                background-color: {self._bg_color};
+                color: {self._text_color};
+            }}
+            {border_radius}
+            {self._toolTip.styleSheet()}
+        """
+        self.applyStyleSheet(style_sheet)
+        # O tom de hover vem pronto do tema (`WindowStyle.hover_bg_color`)
+        self._edit_delegate.setColors(
+            self._bg_color, self._hover_bg_color or self._bg_color.shade()
+        )
+        self.viewport().update()
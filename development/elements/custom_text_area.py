@@ -1,9 +1,61 @@
 from PySide6.QtWidgets import QTextEdit, QLabel, QVBoxLayout, QWidget
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QMimeData
+from PySide6.QtGui import QFont, QInputMethodEvent, QKeyEvent
 from development.styles import Colors, Border, type_border, Border, Padding, BorderRadius
 from development.elements import CTooltip
 from development.model import Instances
-import re
+from .custom_filter import build_filter
+
+
+class _FilteredTextEdit(QTextEdit):
+    """`QTextEdit` que filtra o texto digitado, colado ou vindo do método de entrada.
+
+    O filtro age antes de o texto chegar ao documento, então cada inserção é um
+    único passo de desfazer, já com o texto filtrado.
+    """
+
+    def __init__(self, text_filter=None):
+        super().__init__()
+        self.text_filter = text_filter
+
+    def keyPressEvent(self, event: QKeyEvent):
+        text = event.text()
+        if self.text_filter and text and (text.isprintable() or text == "\r"):
+            typed = "\n" if text == "\r" else text
+            filtered = self.text_filter(typed)
+            if filtered != typed:
+                if filtered:
+                    event = QKeyEvent(
+                        event.type(),
+                        event.key(),
+                        event.modifiers(),
+                        filtered,
+                        event.isAutoRepeat(),
+                        event.count(),
+                    )
+                else:
+                    event.accept()
+                    return
+        super().keyPressEvent(event)
+
+    def insertFromMimeData(self, source: QMimeData):
+        if self.text_filter and source.hasText():
+            filtered = QMimeData()
+            filtered.setText(self.text_filter(source.text()))
+            source = filtered
+        super().insertFromMimeData(source)
+
+    def inputMethodEvent(self, event: QInputMethodEvent):
+        commit = event.commitString()
+        if self.text_filter and commit:
+            filtered = self.text_filter(commit)
+            if filtered != commit:
+                replacement = QInputMethodEvent(event.preeditString(), event.attributes())
+                replacement.setCommitString(
+                    filtered, event.replacementStart(), event.replacementLength()
+                )
+                event = replacement
+        super().inputMethodEvent(event)
 
 
 class CTextArea(QWidget, Instances):
@@ -55,16 +107,16 @@ class CTextArea(QWidget, Instances):
         self.no_special_chars = no_special_chars
         self.only_uppercase = only_uppercase
         self.value = value
+        self.text_filter = build_filter(only_numbers, no_special_chars, only_uppercase)
 
         self.label = QLabel(label)
-        self.text_area = QTextEdit()
+        self.text_area = _FilteredTextEdit(self.text_filter)
         self.text_area.setObjectName(objectName)
         self.text_area.setPlaceholderText(placeholder)
 
         if self.value:
             self.text_area.setText(str(self.value))
 
-        self.text_area.textChanged.connect(self.__on_text_changed)
         self.text_area.setFont(QFont("Arial", self._font_size))
         
         self._toolTip = CTooltip(
@@ -190,44 +242,26 @@ class CTextArea(QWidget, Instances):
             {hover_border}
             {self._toolTip.styleSheet()}
         """
-        self.setStyleSheet(style_sheet)
-        self.text_area.setStyleSheet(style_sheet)
-        self.label.setStyleSheet(style_sheet)
+        self.applyStyleSheet(style_sheet, self, self.text_area, self.label)
         self.update()
 
     def apply_filters(self, text: str) -> str:
-        if self.only_numbers:
-            text = re.sub(r'\D', '', text)
-        if self.no_special_chars:
-            text = re.sub(r'[^a-zA-Z0-9 ]', '', text)
-        if self.only_uppercase:
-            text = text.upper()
-        return text
-    
-    def __on_text_changed(self):
-        text = self.text_area.toPlainText()
-        filtered_text = self.apply_filters(text)
-
-        # Armazena a posição do cursor antes da alteração
-        cursor_position = self.text_area.textCursor().position()
-
-        self.text_area.blockSignals(True)
+        return self.text_filter(text)
 
-        # Só altera o texto após salvar a posição do cursor
-        self.text_area.setPlainText(filtered_text)
-
-        # Restaura a posição do cursor para onde estava antes da alteração
-        cursor = self.text_area.textCursor()
-        cursor.setPosition(cursor_position if cursor_position <= len(filtered_text) else len(filtered_text))
-        self.text_area.setTextCursor(cursor)
-
-        self.text_area.blockSignals(False)
+    def __update_filter(self):
+        self.text_filter = build_filter(
+            self.only_numbers, self.no_special_chars, self.only_uppercase
+        )
+        self.text_area.text_filter = self.text_filter
 
     def setOnlyNumbers(self, role: bool):
         self.only_numbers = role
+        self.__update_filter()
 
     def setNoSpecialChars(self, role: bool):
         self.no_special_chars = role
+        self.__update_filter()
 
     def setOnlyUppercase(self, role: bool):
-        self.only_uppercase = role
\ No newline at end of file
+        self.only_uppercase = role
+        self.__update_filter()
\ No newline at end of file
@@ -2,10 +2,9 @@ from PySide6.QtWidgets import (
     QWidget,
     QPushButton,
 )
-from PySide6.QtGui import QIcon, QImage, QPainter, Qt
+from PySide6.QtGui import Qt
 from PySide6.QtCore import QSize
-from PySide6.QtSvg import QSvgRenderer
-import os
+from development.styles import icon_cache, style_sheets
 
 
 class ToggleTheme(QPushButton):
@@ -56,15 +55,9 @@ class ToggleTheme(QPushButton):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
     def set_icon(self, icon_path: str):
-        renderer = QSvgRenderer(icon_path)
-        image = QImage(self._iconSize[0], self._iconSize[1], QImage.Format_ARGB32)
-        image.fill(0)
-        painter = QPainter(image)
-        renderer.render(painter)
-        painter.end()
-
-        self.setIcon(QIcon(icon_path))
-        self.setIconSize(QSize(self._iconSize[0] - 10, self._iconSize[1] - 10))
+        size = QSize(self._iconSize[0] - 10, self._iconSize[1] - 10)
+        self.setIcon(icon_cache.icon(icon_path, size, self.devicePixelRatioF()))
+        self.setIconSize(size)
 
     def switch_theme(self):
         """Switches the theme and updates the icon."""
@@ -101,7 +94,7 @@ class ToggleTheme(QPushButton):
             }}
             """
 
-        self.setStyleSheet(light if self.default_theme else dark)
+        style_sheets.apply(self, light if self.default_theme else dark)
 
         self.setToolTip("Light ativo" if self.default_theme else "Dark ativo")
         self.set_icon(self._icon_light if self.default_theme else self._icon_dark)
@@ -2,6 +2,7 @@ from development.styles.colors import Colors
 from development.styles.border import Border
 from development.styles.border_radius import BorderRadius
 from development.styles.padding import Padding
+from development.styles.stylesheet import style_sheets
 
 
 class Instances:
@@ -46,3 +47,8 @@ class Instances:
         self._border_radius = border_radius
         self._padding = padding
         self._font_size = font_size
+
+    def applyStyleSheet(self, style_sheet: str, *widgets) -> None:
+        """Aplica a folha em `self` (ou nos widgets informados), pulando os que já a têm."""
+        for widget in widgets or (self,):
+            style_sheets.apply(widget, style_sheet)
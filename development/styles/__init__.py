@@ -2,4 +2,6 @@ from .colors import Colors, rgba
 from .border import Border, type_border
 from .themes import Themes
 from .border_radius import BorderRadius
-from .padding import Padding
\ No newline at end of file
+from .padding import Padding
+from .icons import IconCache, icon_cache
+from .stylesheet import StyleSheetCache, style_sheets
\ No newline at end of file
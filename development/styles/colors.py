@@ -1,38 +1,96 @@
+from typing import Dict
 from PySide6.QtGui import QColor
 
 class rgba:
-    def __init__(self, r: int = 255, g: int = 255, b: int = 255, a: int | float = 1.0):
-        self.r = r
-        self.g = g
-        self.b = b
-        self.a = a
+    """Cor RGBA imutável e "hashable", podendo ser usada como chave de cache.
+
+    Instâncias com os mesmos canais são a mesma instância (internadas), e os
+    tons derivados (`adjust_tonality`, `shade`) são calculados uma única vez:
+    depois disso custam uma consulta a dicionário.
+    """
+
+    __slots__ = ("r", "g", "b", "a", "_hash")
+
+    _interned: Dict[tuple, "rgba"] = {}
+    _tones: Dict[tuple, "rgba"] = {}
+
+    def __new__(cls, r: int = 255, g: int = 255, b: int = 255, a: int | float = 1.0):
+        key = (r, g, b, a)
+        color = cls._interned.get(key)
+        if color is None:
+            color = object.__new__(cls)
+            object.__setattr__(color, "r", r)
+            object.__setattr__(color, "g", g)
+            object.__setattr__(color, "b", b)
+            object.__setattr__(color, "a", a)
+            object.__setattr__(color, "_hash", hash(key))
+            color = cls._interned.setdefault(key, color)
+        return color
+
+    def __setattr__(self, name, value):
+        raise AttributeError("rgba é imutável; use os métodos que retornam uma nova cor.")
+
+    def __delattr__(self, name):
+        raise AttributeError("rgba é imutável.")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, rgba):
+            return NotImplemented
+        return (self.r, self.g, self.b, self.a) == (other.r, other.g, other.b, other.a)
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (rgba, (self.r, self.g, self.b, self.a))
 
     def __repr__(self):
         return f"rgba({self.r}, {self.g}, {self.b}, {self.a})"
-    
-    def adjust_tonality(self, percentage: int = 50, yourself: bool = False):
-        """Ajusta a tonalidade da cor sem modificar a instância original (a menos que `yourself=True`).
-        
+
+    def adjust_tonality(self, percentage: int = 50) -> "rgba":
+        """Ajusta a tonalidade da cor, retornando outra cor (memorizada).
+
         A cor escurece abaixo de 50% até 0% (preto) e clareia acima de 50% até 100% (branco).
         """
+        key = (self, "tonality", percentage)
+        tone = self._tones.get(key)
+        if tone is not None:
+            return tone
 
         percentage = max(0, min(100, percentage))
 
         if percentage == 50:
-            return self if yourself else rgba(self.r, self.g, self.b, self.a)
-
-        factor = (abs(percentage - 50) * 2)
-        
-        if percentage > 50:
-            r, g, b = min(255, self.r + factor), min(255, self.g + factor), min(255, self.b + factor)
+            tone = self
         else:
-            r, g, b = max(0, self.r - factor), max(0, self.g - factor), max(0, self.b - factor)
+            factor = (abs(percentage - 50) * 2)
 
-        if yourself:
-            self.r, self.g, self.b = r, g, b
-            return self
+            if percentage > 50:
+                r, g, b = min(255, self.r + factor), min(255, self.g + factor), min(255, self.b + factor)
+            else:
+                r, g, b = max(0, self.r - factor), max(0, self.g - factor), max(0, self.b - factor)
+            tone = rgba(r, g, b, self.a)
 
-        return rgba(r, g, b, self.a)
+        self._tones[key] = tone
+        return tone
+
+    def shade(self, exponent: float = 0.95) -> "rgba":
+        """Escurece elevando cada canal ao expoente (`canal ** 0.95`), com memorização.
+
+        É o tom usado no hover das células das tabelas.
+        """
+        key = (self, "shade", exponent)
+        tone = self._tones.get(key)
+        if tone is None:
+            tone = rgba(
+                round(self.r**exponent), round(self.g**exponent), round(self.b**exponent), self.a
+            )
+            self._tones[key] = tone
+        return tone
+
+    def to_qcolor(self) -> QColor:
+        return QColor(int(self.r), int(self.g), int(self.b), int(self.a * 255))
 
 
 def adjust_color(color: rgba, factor, is_percentage=False):
@@ -73,12 +131,13 @@ class Colors:
     transparent = rgba(0, 0, 0, 0)
 
     @staticmethod
-    def adjust_color_for_all(factor, is_percentage=False):
-        """Ajusta a tonalidade de todas as cores definidas na classe Colors."""
-        adjusted_colors = {
+    def adjust_color_for_all(factor, is_percentage=False) -> Dict[str, rgba]:
+        """Retorna todas as cores da classe Colors com a tonalidade ajustada.
+
+        A classe não é alterada: quem chama decide onde usar a paleta ajustada.
+        """
+        return {
             color: adjust_color(getattr(Colors, color), factor, is_percentage)
             for color in dir(Colors)
             if isinstance(getattr(Colors, color), rgba)
         }
-        for color, adjusted in adjusted_colors.items():
-            setattr(Colors, color, adjusted)
@@ -0,0 +1,183 @@
+import base64
+import binascii
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QByteArray, QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+from .colors import rgba
+
+
+class IconCache:
+    """Cache LRU de ícones do processo, com chave (origem, tamanho, DPR, tinta).
+
+    A origem pode ser o caminho de um arquivo (SVG, PNG, JPG...) ou o conteúdo
+    em Base64. Cada arquivo é lido/decodificado uma única vez e cada combinação
+    de tamanho, densidade de pixels e cor é rasterizada uma única vez; os
+    pedidos seguintes devolvem o mesmo `QPixmap`/`QIcon`.
+
+    Deve ser usado apenas na thread da interface, como todo `QPixmap`.
+    """
+
+    def __init__(self, max_entries: int = 256, max_sources: int = 64):
+        self.max_entries = max_entries
+        self.max_sources = max_sources
+        self.hits = 0
+        self.misses = 0
+
+        self._pixmaps: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._icons: "OrderedDict[tuple, QIcon]" = OrderedDict()
+        self._sources: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def _qcolor(color) -> QColor:
+        if isinstance(color, QColor):
+            return color
+        if isinstance(color, rgba):
+            return color.to_qcolor()
+        return QColor(str(color))
+
+    @staticmethod
+    def _get(cache: OrderedDict, key):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _put(cache: OrderedDict, key, value, limit: int):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def _load(self, source: str) -> tuple:
+        """Decodifica a origem uma vez: `(renderizador SVG, None)` ou `(None, pixmap)`."""
+        loaded = self._get(self._sources, source)
+        if loaded is not None:
+            return loaded
+
+        renderer, pixmap = None, None
+        if os.path.exists(source):
+            if source.lower().endswith(".svg"):
+                renderer = QSvgRenderer(source)
+            else:
+                pixmap = QPixmap(source)
+        else:
+            try:
+                data = base64.b64decode(source)
+            except (binascii.Error, ValueError):
+                data = b""
+            if b"<svg" in data:
+                renderer = QSvgRenderer(QByteArray(data))
+            else:
+                pixmap = QPixmap()
+                pixmap.loadFromData(data)
+
+        if renderer is not None and not renderer.isValid():
+            renderer, pixmap = None, QPixmap()
+
+        loaded = (renderer, pixmap)
+        self._put(self._sources, source, loaded, self.max_sources)
+        return loaded
+
+    def _rasterize(self, source: str, size: QSize, device_pixel_ratio: float, tint) -> QPixmap:
+        renderer, image = self._load(source)
+        width = max(1, round(size.width() * device_pixel_ratio))
+        height = max(1, round(size.height() * device_pixel_ratio))
+
+        if renderer is not None:
+            pixmap = QPixmap(width, height)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+        elif image is not None and not image.isNull():
+            pixmap = image.scaled(width, height, mode=Qt.SmoothTransformation)
+        else:
+            return QPixmap()
+
+        if tint is not None:
+            painter = QPainter(pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            painter.fillRect(pixmap.rect(), self._qcolor(tint))
+            painter.end()
+
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    def pixmap(
+        self,
+        source: str,
+        size: "QSize | tuple[int, int]" = QSize(20, 20),
+        device_pixel_ratio: float = 1.0,
+        tint: "rgba | QColor | str | None" = None,
+    ) -> QPixmap:
+        """Pixmap da origem no tamanho lógico informado, já na densidade da tela."""
+        if not isinstance(size, QSize):
+            size = QSize(*size)
+        tint_key = None if tint is None else self._qcolor(tint).rgba()
+        key = (source, size.width(), size.height(), float(device_pixel_ratio), tint_key)
+
+        pixmap = self._get(self._pixmaps, key)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        pixmap = self._rasterize(source, size, float(device_pixel_ratio), tint)
+        self._put(self._pixmaps, key, pixmap, self.max_entries)
+        return pixmap
+
+    def icon(
+        self,
+        source: str,
+        size: "QSize | tuple[int, int] | None" = None,
+        device_pixel_ratio: float = 1.0,
+        tint: "rgba | QColor | str | None" = None,
+    ) -> QIcon:
+        """`QIcon` compartilhado; sem `size`, arquivos viram um ícone escalável.
+
+        Origens em Base64 sem tamanho são rasterizadas em 128x128.
+        """
+        if size is None and tint is None and os.path.exists(source):
+            key = (source, None)
+            icon = self._get(self._icons, key)
+            if icon is None:
+                self.misses += 1
+                icon = QIcon(source)
+                self._put(self._icons, key, icon, self.max_entries)
+            else:
+                self.hits += 1
+            return icon
+
+        if size is None:
+            size = QSize(128, 128)
+        if not isinstance(size, QSize):
+            size = QSize(*size)
+        tint_key = None if tint is None else self._qcolor(tint).rgba()
+        key = (source, size.width(), size.height(), float(device_pixel_ratio), tint_key)
+
+        icon = self._get(self._icons, key)
+        if icon is not None:
+            self.hits += 1
+        else:
+            pixmap = self.pixmap(source, size, device_pixel_ratio, tint)
+            icon = QIcon(pixmap) if not pixmap.isNull() else QIcon()
+            self._put(self._icons, key, icon, self.max_entries)
+        return icon
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._icons.clear()
+        self._sources.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._pixmaps) + len(self._icons)
+
+
+icon_cache = IconCache()
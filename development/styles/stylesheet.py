@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+
+class StyleSheetCache:
+    """Interna as folhas de estilo geradas e evita reaplicá-las sem mudança.
+
+    Montar a f-string de um `update_styles` custa microssegundos; o caro é o
+    `setStyleSheet`, que faz o Qt reinterpretar a folha e repolir o widget e
+    todos os filhos. Folhas iguais viram o mesmo objeto `str`, então comparar
+    com a última folha aplicada no widget é só uma checagem de identidade.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.applied = 0
+        self.skipped = 0
+        self._sheets: "OrderedDict[str, str]" = OrderedDict()
+
+    def intern(self, style_sheet: str) -> str:
+        interned = self._sheets.get(style_sheet)
+        if interned is None:
+            interned = self._sheets[style_sheet] = style_sheet
+            while len(self._sheets) > self.max_entries:
+                self._sheets.popitem(last=False)
+        else:
+            self._sheets.move_to_end(style_sheet)
+        return interned
+
+    def apply(self, widget, style_sheet: str) -> bool:
+        """Aplica a folha no widget; retorna False quando ela já estava aplicada."""
+        style_sheet = self.intern(style_sheet)
+        if getattr(widget, "_applied_style_sheet", None) is style_sheet:
+            self.skipped += 1
+            return False
+
+        widget.setStyleSheet(style_sheet)
+        widget._applied_style_sheet = style_sheet
+        self.applied += 1
+        return True
+
+    def clear(self) -> None:
+        self._sheets.clear()
+        self.applied = 0
+        self.skipped = 0
+
+
+style_sheets = StyleSheetCache()
@@ -1,13 +1,18 @@
-from development.styles.colors import Colors
+from development.styles.colors import Colors, rgba
 from development.styles.border import Border
 
 
 class WindowStyle:
+    """Paleta de uma área do tema, com os tons derivados já calculados na importação."""
+
+    __slots__ = ("bg_color", "fg_color", "text_color", "border", "hover_bg_color")
+
     def __init__(self, bg_color = None, fg_color = None, text_color = None, border = None):
         self.bg_color = bg_color
         self.fg_color = fg_color
         self.text_color = text_color
         self.border = border
+        self.hover_bg_color = bg_color.shade() if isinstance(bg_color, rgba) else None
 
 
 class Themes:
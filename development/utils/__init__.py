@@ -1 +1,7 @@
-from .occurrence import Occurrence
\ No newline at end of file
+from .occurrence import Occurrence
+from .importer import ImportReport, bulk_import
+from .worker import DatabaseWorker, DatabaseFuture
+from .scheduler import RefreshScheduler
+from .startup import StartupPipeline
+from .watchdog import StallReport, StallWatchdog
+from .profiling import Profiler, profiled, profiler
\ No newline at end of file
@@ -1,7 +1,6 @@
-import os
-from typing import Tuple, Optional, List
-import pyperclip
+from typing import Any, Iterable, Tuple, Optional, List
 import development.database
+from .importer import ImportReport, bulk_import
 
 class Occurrence:
     def __init__(
@@ -21,6 +20,7 @@ class Occurrence:
         reference_point: str = None,
         observations: str = None,
         is_vehicle: bool = True,
+        created_at: str = None,
     ):
         self.id = id
         self.name = name
@@ -37,38 +37,20 @@ class Occurrence:
         self.reference_point = reference_point
         self.observations = observations
         self.is_vehicle = is_vehicle
+        self.created_at = created_at
         self.db_path = "app/database/database.db"
-        self.db_manager = development.database.SQLiteManager(db_name=self.db_path)
+        self._db_manager = None
 
-        self.create_table()
+    @property
+    def db_manager(self) -> "development.database.SQLiteManager":
+        """Gerenciador do banco, criado só quando a ocorrência acessa o banco."""
+        if self._db_manager is None or self._db_manager.db_name != self.db_path:
+            self._db_manager = development.database.SQLiteManager(db_name=self.db_path)
+        return self._db_manager
 
     def create_table(self):
-        db_dir = os.path.dirname(self.db_path)
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-
-        
-
-        with self.db_manager as db:
-            db.execute("""
-                CREATE TABLE IF NOT EXISTS occurrences (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    phone TEXT,
-                    highway TEXT,
-                    km INTEGER,
-                    direction TEXT,
-                    vehicle TEXT,
-                    color TEXT,
-                    license_plate TEXT,
-                    problem TEXT,
-                    occupantes TEXT,
-                    local TEXT,
-                    reference_point TEXT,
-                    observations TEXT,
-                    is_vehicle BOOLEAN
-                );
-            """)
+        """Garante o esquema do banco (executado uma única vez por processo)."""
+        development.database.bootstrap(self.db_path)
 
     def __converte_km(self, km: int) -> str | None:
         self.new_km: int = None
@@ -108,26 +90,52 @@ class Occurrence:
         else:
             texto = f"{observacao}RODOVIA: {self.highway}\nKM: {self.__converte_km(int(self.km))}\nSENTIDO: {self.direction}\n\nPROBLEMA: {self.problem}\nENCONTRA-SE: {self.local}\n\nPONTO DE REFERÊNCIA: {self.reference_point}"
 
+        import pyperclip  # Só carregado ao copiar
+
         pyperclip.copy(texto)
     
+    def _normalize_plate(self) -> None:
+        # `lookup` compara a placa exatamente (usa o índice), então ela é gravada em maiúsculas
+        if self.license_plate:
+            self.license_plate = self.license_plate.strip().upper()
+
     def save(self) -> int:
+        self._normalize_plate()
         query = """
         INSERT INTO occurrences (
             name, phone, highway, km, direction, vehicle, color, 
-            license_plate, problem, occupantes, local, reference_point, observations, is_vehicle
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            license_plate, problem, occupantes, local, reference_point, observations, is_vehicle,
+            created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now', 'localtime')))
         """
         params: Tuple = (
             self.name, self.phone, self.highway, self.km, self.direction,
             self.vehicle, self.color, self.license_plate, self.problem,
-            self.occupantes, self.local, self.reference_point, self.observations, self.is_vehicle
+            self.occupantes, self.local, self.reference_point, self.observations, self.is_vehicle,
+            self.created_at
         )
         return self.execute(query, params, fetch_id=True)
 
+    @classmethod
+    def bulk_save(
+        cls,
+        records: Iterable[Any],
+        db_path: str = "app/database/database.db",
+        chunk_size: int = 1000,
+        **options,
+    ) -> ImportReport:
+        """Insere várias ocorrências em lotes, sem uma conexão e um commit por linha.
+
+        Aceita `Occurrence`, `OccurrenceRow` ou dicionários com os mesmos campos;
+        `options` vai para `bulk_import` (`strict`, `max_errors`, `on_progress`).
+        """
+        return bulk_import(records, db_name=db_path, chunk_size=chunk_size, **options)
+
     def update(self):
         if self.id is None:
             raise ValueError("ID da ocorrência não pode ser None para atualizar.")
 
+        self._normalize_plate()
         query = """
         UPDATE occurrences
         SET name=?, phone=?, highway=?, km=?, direction=?, vehicle=?, color=?, 
@@ -151,9 +159,12 @@ class Occurrence:
     def execute(self, query: str, params: Tuple = (), fetch_id: bool = False) -> Optional[int]:
         with self.db_manager as db:
             db.execute(query, params)
-            if fetch_id:
-                return db.cursor.lastrowid
-        return None
+            row_id = db.cursor.lastrowid if fetch_id else None
+
+        # Contagens e páginas de busca em cache deixam de valer após qualquer escrita
+        development.database.count_cache.invalidate(self.db_path)
+        development.database.page_cache.invalidate(self.db_path)
+        return row_id
 
     def searchPagination(self, search: Optional[str] = None, page: int = 1, rows: int = 15) -> List['Occurrence']:
         offset = (page - 1) * rows
@@ -212,7 +223,7 @@ class Occurrence:
 
         query = """
         SELECT id, name, phone, highway, km, direction, vehicle, color, license_plate, 
-            problem, occupantes, local, reference_point, observations, is_vehicle
+            problem, occupantes, local, reference_point, observations, is_vehicle, created_at
         FROM occurrences
         WHERE id = ?
         """
@@ -237,5 +248,6 @@ class Occurrence:
             self.reference_point = result[12]
             self.observations = result[13]
             self.is_vehicle = result[14]
+            self.created_at = result[15]
         else:
             raise ValueError(f"Ocorrência com ID {self.id} não encontrada.")
@@ -0,0 +1,85 @@
+import cProfile
+import functools
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional, Set
+
+
+class Profiler:
+    """`cProfile` opcional em operações nomeadas, com o resultado salvo em `.pstats`.
+
+    Só as operações ativadas são perfiladas; as outras rodam sem custo além de
+    uma consulta a um conjunto. Cada chamada gera um arquivo em `directory`,
+    que pode ser lido com `python -m pstats arquivo.pstats` ou pelo snakeviz.
+
+    `COI_PROFILE` ativa as operações (`load_page,save_form` ou `all`) e
+    `COI_PROFILE_DIR` escolhe a pasta (padrão: `profiles`). O `cProfile` só
+    observa a thread atual, então o trabalho enviado ao `DatabaseWorker` é
+    perfilado dentro da tarefa (`load_page` é a consulta do lote,
+    `load_page_fill`, a inserção dele no modelo, e `save_form`, a escrita dos
+    formulários).
+    """
+
+    def __init__(self, operations: Iterable[str] = (), directory: str = "profiles"):
+        self.operations: Set[str] = set(operations)
+        self.directory = directory
+        self.dumps = []
+        self._local = threading.local()
+
+    def enabled(self, name: str) -> bool:
+        return name in self.operations or "all" in self.operations
+
+    def enable(self, *names: str) -> None:
+        self.operations.update(names)
+
+    def disable(self, *names: str) -> None:
+        """Desativa as operações informadas (ou todas, se nenhuma for informada)."""
+        if names:
+            self.operations.difference_update(names)
+        else:
+            self.operations.clear()
+
+    def run(self, name: str, function: Callable, *args, **kwargs):
+        # Uma operação dentro de outra já aparece no perfil da externa
+        if not self.enabled(name) or getattr(self._local, "active", False):
+            return function(*args, **kwargs)
+
+        profile = cProfile.Profile()
+        self._local.active = True
+        started = time.perf_counter()
+        try:
+            return profile.runcall(function, *args, **kwargs)
+        finally:
+            self._local.active = False
+            self._dump(name, profile, time.perf_counter() - started)
+
+    def _dump(self, name: str, profile: cProfile.Profile, elapsed: float) -> Optional[str]:
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(self.directory, f"{name}-{stamp}-{elapsed * 1000:.0f}ms.pstats")
+        profile.dump_stats(path)
+        self.dumps.append(path)
+        return path
+
+
+def _from_environment() -> Profiler:
+    operations = [name.strip() for name in os.environ.get("COI_PROFILE", "").split(",") if name.strip()]
+    return Profiler(operations, os.environ.get("COI_PROFILE_DIR") or "profiles")
+
+
+profiler = _from_environment()
+
+
+def profiled(name: str) -> Callable:
+    """Decorador: perfila a função com o `profiler` quando a operação `name` está ativa."""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return profiler.run(name, function, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
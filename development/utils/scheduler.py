@@ -0,0 +1,51 @@
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class RefreshScheduler(QObject):
+    """Agenda tarefas nomeadas na thread da interface sem bloquear o loop de eventos.
+
+    Pedidos repetidos com a mesma chave são agrupados: o temporizador é
+    reiniciado (debounce) e só o último callback roda, uma única vez, quando os
+    pedidos param de chegar por `delay` milissegundos.
+    """
+
+    def __init__(self, parent: QObject = None, delay: int = 0):
+        super().__init__(parent)
+        self.delay = delay
+        self._timers: Dict[str, QTimer] = {}
+        self._callbacks: Dict[str, Callable[[], None]] = {}
+
+    def schedule(self, key: str, callback: Callable[[], None], delay: Optional[int] = None) -> None:
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._run(key))
+            self._timers[key] = timer
+
+        self._callbacks[key] = callback
+        timer.start(self.delay if delay is None else delay)
+
+    def pending(self, key: str) -> bool:
+        return key in self._callbacks
+
+    def cancel(self, key: str) -> None:
+        self._callbacks.pop(key, None)
+        timer = self._timers.get(key)
+        if timer is not None:
+            timer.stop()
+
+    def flush(self, key: Optional[str] = None) -> None:
+        """Executa agora o que estiver pendente (uma chave ou todas)."""
+        for pending in [key] if key is not None else list(self._callbacks):
+            timer = self._timers.get(pending)
+            if timer is not None:
+                timer.stop()
+            self._run(pending)
+
+    def _run(self, key: str) -> None:
+        callback = self._callbacks.pop(key, None)
+        if callback is not None:
+            callback()
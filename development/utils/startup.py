@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+
+
+class StartupPipeline(QObject):
+    """Cronometra a inicialização e adia o que não aparece no primeiro quadro.
+
+    Tarefas registradas com `defer` só rodam depois que a janela observada em
+    `watch` pinta pela primeira vez, uma por ciclo do loop de eventos, para a
+    janela aparecer antes do trabalho que não é visível de imediato.
+
+    Com a variável de ambiente `COI_STARTUP_REPORT` definida, o relatório de
+    tempos é impresso no `stderr` quando a última tarefa adiada termina.
+    """
+
+    firstFrame = Signal()
+    finished = Signal()
+
+    def __init__(self, started_at: Optional[float] = None, parent: QObject = None):
+        super().__init__(parent)
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.marks: List[Tuple[str, float]] = []
+        self._deferred: List[Tuple[str, Callable[[], None]]] = []
+        self._window: Optional[QObject] = None
+        self._painted = False
+        self._report = bool(os.environ.get("COI_STARTUP_REPORT"))
+
+    def mark(self, label: str) -> float:
+        """Registra uma etapa; retorna os ms desde o início do processo."""
+        elapsed = (time.perf_counter() - self.started_at) * 1000
+        self.marks.append((label, elapsed))
+        return elapsed
+
+    def defer(self, label: str, callback: Callable[[], None]) -> None:
+        """Agenda `callback` para depois do primeiro quadro (ou já, se ele passou)."""
+        self._deferred.append((label, callback))
+        if self._painted and len(self._deferred) == 1:
+            QTimer.singleShot(0, self._run_next)
+
+    def watch(self, window: QObject) -> None:
+        """Observa a janela para saber quando o primeiro quadro foi pintado."""
+        if self._window is None:
+            self._window = window
+            window.installEventFilter(self)
+
+    def first_frame_done(self) -> bool:
+        return self._painted
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._window and event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            self._painted = True
+            self.mark("primeiro quadro")
+            self.firstFrame.emit()
+            # Só depois de o quadro ir para a tela
+            QTimer.singleShot(0, self._run_next)
+        return False
+
+    def _run_next(self) -> None:
+        if not self._deferred:
+            return
+
+        label, callback = self._deferred.pop(0)
+        try:
+            callback()
+        finally:
+            self.mark(label)
+            if self._deferred:
+                QTimer.singleShot(0, self._run_next)
+            else:
+                self.finished.emit()
+                if self._report:
+                    print(self.report(), file=sys.stderr)
+
+    def report(self) -> str:
+        lines = ["Inicialização (ms desde o início do processo):"]
+        previous = 0.0
+        for label, elapsed in self.marks:
+            lines.append(f"  {label:<24} {elapsed:9.1f}  (+{elapsed - previous:.1f})")
+            previous = elapsed
+        return "\n".join(lines)
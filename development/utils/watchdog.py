@@ -0,0 +1,167 @@
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+def _where(filename: str) -> str:
+    try:
+        return os.path.relpath(filename)
+    except ValueError:
+        # No Windows, arquivos em outra unidade não têm caminho relativo
+        return filename
+
+
+class StallReport:
+    """Um travamento do loop de eventos e as pilhas amostradas durante ele."""
+
+    def __init__(self, started_at: datetime, duration: float, stacks: Counter):
+        self.started_at = started_at
+        self.duration = duration
+        self.samples = sum(stacks.values())
+        # Pilha mais frequente primeiro: é onde a thread da interface passou mais tempo
+        self.stacks: List[Tuple[int, List[str]]] = [
+            (count, list(stack)) for stack, count in stacks.most_common()
+        ]
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            "at": self.started_at.isoformat(timespec="milliseconds"),
+            "ms": round(self.duration_ms, 1),
+            "samples": self.samples,
+            "stacks": [{"count": count, "stack": stack} for count, stack in self.stacks],
+        }
+
+    def format(self, limit: int = 3) -> str:
+        lines = [
+            f"Loop de eventos travado por {self.duration_ms:.0f} ms "
+            f"({self.started_at:%H:%M:%S}, {self.samples} amostras)"
+        ]
+        for count, stack in self.stacks[:limit]:
+            lines.append(f"  {count}x:")
+            lines.extend(f"    {frame}" for frame in stack)
+        return "\n".join(lines)
+
+
+class StallWatchdog(QObject):
+    """Detecta travamentos do loop de eventos do Qt e mostra onde eles aconteceram.
+
+    Um `QTimer` na thread da interface bate a cada `interval_ms`; uma thread de
+    amostragem confere a última batida a cada `sample_ms` e, passado o limite de
+    `threshold_ms` sem batida, registra a pilha Python da thread da interface
+    (consultas síncronas, `setStyleSheet`, loops longos...). Quando o loop volta,
+    as amostras viram um `StallReport`, emitido em `stalled`.
+
+    Com `COI_STALL_MS` definida, `from_environment` cria o watchdog com esse
+    limite; os relatórios vão para o `stderr` ou, com `COI_STALL_LOG`, para um
+    arquivo JSON Lines.
+    """
+
+    stalled = Signal(object)
+
+    def __init__(
+        self,
+        threshold_ms: float = 200,
+        interval_ms: int = 50,
+        sample_ms: float = 10,
+        max_depth: int = 30,
+        log_path: Optional[str] = None,
+        parent: QObject = None,
+    ):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.sample_interval = sample_ms / 1000
+        self.max_depth = max_depth
+        self.log_path = log_path
+
+        self.stalls = 0
+        self.max_latency = 0.0
+        self.reports: List[StallReport] = []
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+        self._last_beat = 0.0
+        self._samples: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._gui_thread = 0
+
+    @classmethod
+    def from_environment(cls, parent: QObject = None) -> Optional["StallWatchdog"]:
+        threshold = os.environ.get("COI_STALL_MS")
+        if not threshold:
+            return None
+        return cls(float(threshold), log_path=os.environ.get("COI_STALL_LOG") or None, parent=parent)
+
+    def start(self) -> None:
+        """Começa a observar; deve ser chamado na thread da interface."""
+        if self._sampler is not None:
+            return
+        self._gui_thread = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name="stall-watchdog", daemon=True)
+        self._sampler.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        gap = now - self._last_beat
+        self._last_beat = now
+        self.max_latency = max(self.max_latency, gap - self.interval)
+
+        if gap < self.threshold:
+            return
+        with self._lock:
+            samples, self._samples = self._samples, Counter()
+        started_at = datetime.fromtimestamp(time.time() - gap)
+        self._report(StallReport(started_at, gap, samples))
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            if time.perf_counter() - self._last_beat < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._gui_thread)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame, limit=self.max_depth)
+            del frame
+            key = tuple(
+                f"{_where(entry.filename)}:{entry.lineno} em {entry.name}"
+                for entry in stack
+            )
+            with self._lock:
+                self._samples[key] += 1
+
+    def _report(self, report: StallReport) -> None:
+        self.stalls += 1
+        self.reports.append(report)
+        del self.reports[:-50]
+
+        if self.log_path:
+            with open(self.log_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(report.to_dict(), ensure_ascii=False) + "\n")
+        else:
+            print(report.format(), file=sys.stderr)
+        self.stalled.emit(report)
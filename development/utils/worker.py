@@ -0,0 +1,228 @@
+import threading
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
+
+import development.database
+from development.database.export import export_occurrences
+from .occurrence import Occurrence
+from .profiling import profiled
+
+
+class DatabaseFuture(QObject):
+    """Resultado de uma operação enviada ao `DatabaseWorker`.
+
+    A operação termina numa thread do pool, mas `finished`/`failed` são
+    emitidos na thread da interface (dona do futuro), então os callbacks podem
+    mexer em widgets livremente.
+    """
+
+    finished = Signal(object)
+    failed = Signal(object)
+    _resolved = Signal()
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self._done = threading.Event()
+        self._delivered = False
+        self._cancelled = False
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self._resolved.connect(self._deliver)
+
+    def then(
+        self,
+        on_result: Callable[[Any], None] = None,
+        on_error: Callable[[BaseException], None] = None,
+    ) -> "DatabaseFuture":
+        """Registra callbacks; se a operação já terminou, eles rodam no próximo ciclo."""
+        if self._delivered:
+            if self._cancelled:
+                return self
+            if self._error is None and on_result:
+                QTimer.singleShot(0, lambda: on_result(self._result))
+            elif self._error is not None and on_error:
+                QTimer.singleShot(0, lambda: on_error(self._error))
+            return self
+
+        if on_result:
+            self.finished.connect(on_result)
+        if on_error:
+            self.failed.connect(on_error)
+        return self
+
+    def cancel(self) -> None:
+        """Descarta o resultado; se ainda não começou, a operação nem é executada."""
+        self._cancelled = True
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: Optional[float] = None):
+        """Bloqueia até o fim da operação (uso fora da thread da interface)."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("Operação no banco não terminou no tempo limite.")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _resolve(self, result=None, error: Optional[BaseException] = None) -> None:
+        """Chamado na thread do pool; a entrega acontece na thread da interface."""
+        self._result = result
+        self._error = error
+        self._done.set()
+        self._resolved.emit()
+
+    @Slot()
+    def _deliver(self) -> None:
+        self._delivered = True
+        if not self._cancelled:
+            if self._error is None:
+                self.finished.emit(self._result)
+            else:
+                self.failed.emit(self._error)
+        self.deleteLater()
+
+
+class _Task(QRunnable):
+    def __init__(self, future: DatabaseFuture, fn: Callable, args: tuple, kwargs: dict):
+        super().__init__()
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        if self.future.cancelled():
+            self.future._resolve()
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.future._resolve(error=e)
+        else:
+            self.future._resolve(result)
+
+
+class DatabaseWorker:
+    """Executa operações do SQLite fora da thread da interface.
+
+    Usa um `QThreadPool` próprio; cada thread do pool recebe a sua conexão do
+    `ConnectionPool`, então as operações não disputam a mesma conexão. Cada
+    chamada devolve um `DatabaseFuture` para a interface assinar o resultado.
+    As ocorrências salvas, editadas ou removidas por ele vão para `db_name`.
+    """
+
+    _instance: Optional["DatabaseWorker"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, db_name: str = "app/database/database.db", max_threads: int = 2):
+        self.db_name = db_name
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        # Os futuros precisam nascer na thread da interface para os callbacks rodarem nela
+        self._owner = QObject()
+
+    @classmethod
+    def instance(cls) -> "DatabaseWorker":
+        """Worker compartilhado do processo."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def submit(self, fn: Callable, *args, **kwargs) -> DatabaseFuture:
+        future = DatabaseFuture(self._owner)
+        self.pool.start(_Task(future, fn, args, kwargs))
+        return future
+
+    def resolved(self, result) -> DatabaseFuture:
+        """Futuro de um resultado já disponível (um lote em cache), entregue no próximo ciclo."""
+        future = DatabaseFuture(self._owner)
+        QTimer.singleShot(0, lambda: future._resolve(result))
+        return future
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Aguarda as operações pendentes (usado no encerramento)."""
+        return self.pool.waitForDone(msecs)
+
+    def save(self, occurrence: Occurrence) -> DatabaseFuture:
+        """Insere a ocorrência; o resultado é o id gerado."""
+
+        # Perfilado aqui: a escrita dos formulários roda na thread do pool
+        @profiled("save_form")
+        def save():
+            occurrence.db_path = self.db_name
+            occurrence.id = occurrence.save()
+            return occurrence.id
+
+        return self.submit(save)
+
+    def bulk_save(self, records, chunk_size: int = 1000, **options) -> DatabaseFuture:
+        """Importação em lote; o resultado é o `ImportReport`."""
+        return self.submit(
+            Occurrence.bulk_save, records, db_path=self.db_name, chunk_size=chunk_size, **options
+        )
+
+    def update(self, occurrence: Occurrence) -> DatabaseFuture:
+        occurrence.db_path = self.db_name
+        return self.submit(profiled("save_form")(occurrence.update))
+
+    def delete(self, occurrence: Occurrence) -> DatabaseFuture:
+        occurrence.db_path = self.db_name
+        return self.submit(occurrence.delete)
+
+    def get(self, id: int) -> DatabaseFuture:
+        """Busca a ocorrência pelo id; o resultado é a `Occurrence` preenchida."""
+
+        def get():
+            occurrence = Occurrence(id=id)
+            occurrence.db_path = self.db_name
+            occurrence.get()
+            return occurrence
+
+        return self.submit(get)
+
+    def searchPagination(
+        self,
+        search: Optional[str] = None,
+        page: int = 1,
+        rows: int = 15,
+        compact: bool = False,
+        cache: bool = False,
+    ) -> DatabaseFuture:
+        """Página por deslocamento; o resultado é um `ResponseSearch`."""
+
+        def search_page():
+            with development.database.SQLiteManager(db_name=self.db_name) as db:
+                return db.searchPagination(
+                    search=search, page=page, rows=rows, compact=compact, cache=cache
+                )
+
+        return self.submit(search_page)
+
+    def searchCursor(
+        self,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        rows: int = 15,
+        compact: bool = False,
+        cache: bool = False,
+    ) -> DatabaseFuture:
+        """Página por cursor (keyset); o resultado é um `ResponseSearch`."""
+
+        def search_page():
+            with development.database.SQLiteManager(db_name=self.db_name) as db:
+                return db.searchCursor(
+                    search=search, cursor=cursor, rows=rows, compact=compact, cache=cache
+                )
+
+        return self.submit(search_page)
+
+    def export(self, output: str, **filters) -> DatabaseFuture:
+        """Exporta para CSV/JSONL (ver `export_occurrences`); o resultado é o `ExportReport`."""
+        return self.submit(export_occurrences, output, db_name=self.db_name, **filters)
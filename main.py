@@ -1,26 +1,24 @@
-from development import (
+import sys
+import time
+
+STARTED_AT = time.perf_counter()
+
+# Imports diretos dos subpacotes: `development.modules` puxaria tudo de uma vez
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QFileDialog
+
+from development.components import (
     CMainWindow,
-    Colors,
-    QApplication,
-    rgba,
-    CLayout,
-    CFrame,
     Navbar,
-    ToggleTheme,
-    Themes,
-    OccurrenceForm,
-    BorderRadius,
-    Border,
-    type_border,
-    Qt,
-    SQLiteManager,
-    CTable,
     OccurrenceEditForm,
-    os,
-    time,
-    sys,
+    OccurrenceForm,
+    OccurrenceTableModel,
+    SearchPipeline,
 )
-from PySide6.QtCore import QTimer
+from development.database import bootstrap
+from development.elements import CFrame, CInput, CLayout, CMessageBox, CTableView, ToggleTheme
+from development.styles import Border, BorderRadius, Colors, Themes, rgba, type_border
+from development.utils import DatabaseWorker, RefreshScheduler, StallWatchdog, StartupPipeline, profiled
 
 
 class App(CMainWindow):
@@ -36,6 +34,8 @@ class App(CMainWindow):
         bg_color: rgba = Colors.gray.adjust_tonality(100),
         text_color: rgba = Colors.black,
         icon: str | bytes = "app/coi.png",
+        startup: StartupPipeline = None,
+        db_name: str = "app/database/database.db",
     ):
 
         super().__init__(
@@ -54,26 +54,35 @@ class App(CMainWindow):
         self.theme_light = Themes.light
         self.theme_dark = Themes.dark
         self.search = None
-        self.page = 1
-        self.rows = 17
-        self.total_pages = None
+        self.rows = 50
         self.total_rows = None
+        self.db_name = db_name
+        worker = DatabaseWorker.instance()
+        self.db_worker = worker if worker.db_name == db_name else DatabaseWorker(db_name)
+        self.scheduler = RefreshScheduler(self)
         self.central_widget = CFrame(
             maximumWidth=4096,
             maximumHeight=2160,
             bg_color=self._bg_color,
         )
         self.setCentralWidget(self.central_widget)
-        self.create_db()
         self.__ui__()
         self.__layout__()
 
+        # Banco, tabela e primeira página só depois de a janela aparecer
+        self.startup = startup or StartupPipeline(parent=self)
+        self.startup.watch(self)
+        self.startup.defer("banco", self.create_db)
+        self.startup.defer("tabela", self.ui_table_panel)
+        self.startup.defer("primeira página", self.load_page)
+
     def __ui__(self):
         self.ui_navbar()
         self.ui_content()
         self.ui_toggle_theme()
         self.ui_occurrence_form()
-        self.ui_table_occurrences()
+        self.ui_occurrences_model()
+        self.table_panel = None
 
     def __layout__(self):
         layout = CLayout(self.central_widget)
@@ -84,7 +93,6 @@ class App(CMainWindow):
         self.main_layout.addWidget(self.content)
 
         self.content_layout.addWidget(self.occurrence_form)
-        self.content_layout.addWidget(self.table_occurrences)
 
     def ui_toggle_theme(self):
         self.btn_toggle_theme = ToggleTheme(
@@ -113,6 +121,7 @@ class App(CMainWindow):
             minimumHeight=555,
             maximumWidth=485,
             maximumHeight=585,
+            db_worker=self.db_worker,
             border_radius=BorderRadius(all=8),
             border=Border(
                 pixel=1,
@@ -121,19 +130,39 @@ class App(CMainWindow):
             ),
         )
 
+    def ui_occurrences_model(self):
+        self.occurrences_model = OccurrenceTableModel(
+            db_name=self.db_name,
+            batch_size=self.rows,
+            worker=self.db_worker,
+        )
+        self.occurrences_model.rowsLoaded.connect(self.set_total_rows)
+        self.occurrences_model.loadFailed.connect(self.show_error)
+
+        self.occurrence_form.update_table = self.load_page
+
+    def ui_table_panel(self):
+        # Em janelas estreitas a tabela nem aparece: é montada após o primeiro quadro
+        self.ui_table_occurrences()
+        self.ui_search()
+        self.content_layout.addWidget(self.table_panel)
+
+        if self.theme != self.theme_light:
+            self.apply_theme()
+        self.update_table_visibility()
+
     def ui_table_occurrences(self):
-        self.table_occurrences = CTable(
-            columns=9,
-            rows=0,
+        self.table_occurrences = CTableView(
+            model=self.occurrences_model,
             vertical=False,
             bg_color=self.theme_light.occurrenceForm.bg_color,
             text_color=self.theme_light.occurrenceForm.text_color,
+            hover_bg_color=self.theme_light.occurrenceForm.hover_bg_color,
             maximumHeight=585,
             maximumWidth=1200,
-            next_action=self.next_page,
-            previous_action=self.previous_page,
             edit_action=self.edit_action,
             update_data=self.upload_data,
+            export_data=self.export_data,
             border_radius=BorderRadius(bottom_left=8, bottom_right=8),
             border=Border(
                 pixel=1,
@@ -141,56 +170,97 @@ class App(CMainWindow):
                 color=Colors.gray.adjust_tonality(80),
             ),
         )
-        self.table_occurrences.set_headers(
-            [
-                "ID",
-                "Nome",
-                "Telefone",
-                "Rodovia",
-                "Km",
-                "Sentido",
-                "Problema",
-                "Encontra-se",
-                "Ponto de referência",
-                "Ações",
-            ]
+
+    def ui_search(self):
+        self.input_search = CInput(
+            placeholder="Buscar por nome, telefone, rodovia, km, veículo ou placa",
+            icon_path=None,
+            bg_color=self.theme_light.occurrenceForm.fg_color,
+            text_color=self.theme_light.occurrenceForm.text_color,
+            maximumWidth=1200,
         )
-        for oc in self.responseSearch.data:
-            self.table_occurrences.add_row(
-                [
-                    str(oc.id),
-                    oc.name,
-                    oc.phone,
-                    oc.highway,
-                    str(oc.km) or "",
-                    oc.direction,
-                    oc.problem,
-                    oc.local,
-                    oc.reference_point,
-                ]
-            )
+        self.input_search.label.hide()
+        self.input_search.layout().setContentsMargins(0, 0, 0, 0)
+        self.input_search.setToolTip("Buscar ocorrências")
 
-        self.occurrence_form.update_table = self.load_page
+        self.search_pipeline = SearchPipeline(
+            model=self.occurrences_model, scheduler=self.scheduler, parent=self
+        )
+        self.search_pipeline.searchChanged.connect(self.set_search)
+        self.input_search.input_field.textChanged.connect(self.search_pipeline.set_text)
+
+        self.table_panel = CFrame(
+            maximumWidth=1200, maximumHeight=585, bg_color=self._bg_color
+        )
+        layout = CLayout(self.table_panel)
+        table_layout = layout.vertical(spacing=5)
+        table_layout.addWidget(self.input_search)
+        table_layout.addWidget(self.table_occurrences)
+
+    def set_search(self, search: str):
+        self.search = search or None
 
     def upload_data(self):
-        self.table_occurrences.btn_update
-        self.table_occurrences.setRowCount(0)
-        self.page = 1
-        QTimer.singleShot(1000, self.update_button_and_load_page)
+        # Cliques seguidos no botão viram uma única recarga
+        self.table_occurrences.btn_update.setEnabled(False)
+        self.scheduler.schedule("refresh", self.update_button_and_load_page, delay=150)
 
     def update_button_and_load_page(self):
         self.load_page()
         
         self.table_occurrences.btn_update.setEnabled(True)
 
+    def export_data(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self,
+            "Exportar ocorrências",
+            "ocorrencias.csv",
+            "CSV (*.csv);;JSON Lines (*.jsonl)",
+        )
+        if not path:
+            return
+
+        format = "jsonl" if "jsonl" in selected else "csv"
+        if not path.lower().endswith(f".{format}"):
+            path += f".{format}"
+
+        # O histórico é lido e gravado aos poucos no worker; a janela segue livre
+        self.table_occurrences.btn_export.setEnabled(False)
+        self.db_worker.export(path, format=format, search=self.search).then(
+            self.on_exported, self.on_export_error
+        )
+
+    def on_exported(self, report):
+        self.table_occurrences.btn_export.setEnabled(True)
+        message = CMessageBox(
+            self,
+            title="Notificação",
+            text=f"{report.rows} ocorrências exportadas para {report.path}",
+        )
+        message.show()
+
+    def on_export_error(self, error: Exception):
+        self.table_occurrences.btn_export.setEnabled(True)
+        self.show_error(error)
+
     def edit_action(self, id: int):
-        from development.utils.occurrence import Occurrence
+        # O formulário fica fora do perfil: o `exec()` dele dura o tempo que o usuário quiser
+        occurrence = self.find_occurrence(id)
+        if occurrence is not None:
+            self.open_edit_form(occurrence)
+        else:
+            self.db_worker.get(id).then(self.open_edit_form, self.show_error)
 
-        occurrence = Occurrence(id=id)
-        occurrence.get()
+    @profiled("edit_action")
+    def find_occurrence(self, id: int):
+        row = self.occurrences_model.find(id)
+        # A linha exibida já tem todos os campos; só vira Occurrence agora
+        return row.to_occurrence(self.db_name) if row is not None else None
 
+    def open_edit_form(self, occurrence):
         occurrenceEditForm = OccurrenceEditForm(
             occurrence=occurrence,
+            db_worker=self.db_worker,
             minimumWidth=400,
             minimumHeight=600,
             maximumWidth=400,
@@ -199,7 +269,6 @@ class App(CMainWindow):
         occurrenceEditForm.setWindowTitle(f"ID: {occurrence.id}")
         occurrenceEditForm.setIcon("app/coi.png")
         occurrenceEditForm.exec()
-        self.page = 1
         self.load_page()
 
     def setThemeLight(self):
@@ -211,11 +280,19 @@ class App(CMainWindow):
         self.occurrence_form._text_color = light.occurrenceForm.text_color
         self.occurrence_form._input_bg_color = light.occurrenceForm.fg_color
         self.occurrence_form._input_border = light.occurrenceForm.border
-        self.table_occurrences._bg_color = light.occurrenceTable.bg_color
-        self.table_occurrences._text_color = light.occurrenceTable.text_color
-        self.table_occurrences._fg_color = light.occurrenceTable.fg_color
-        self.table_occurrences.btn_update._bg_color = "#AEFFAE"
-        self.table_occurrences.btn_update._hover_bg_color = "#94FF94"
+
+        if self.table_panel is not None:
+            self.table_panel._bg_color = light.window.bg_color
+            self.input_search._bg_color = light.occurrenceForm.fg_color
+            self.input_search._text_color = light.occurrenceForm.text_color
+            self.table_occurrences._bg_color = light.occurrenceTable.bg_color
+            self.table_occurrences._text_color = light.occurrenceTable.text_color
+            self.table_occurrences._fg_color = light.occurrenceTable.fg_color
+            self.table_occurrences._hover_bg_color = light.occurrenceTable.hover_bg_color
+            self.table_occurrences.btn_update._bg_color = "#AEFFAE"
+            self.table_occurrences.btn_update._hover_bg_color = "#94FF94"
+            self.table_occurrences.btn_export._bg_color = "#AED6FF"
+            self.table_occurrences.btn_export._hover_bg_color = "#94C9FF"
 
     def setThemeDark(self):
         dark = self.theme_dark
@@ -226,11 +303,19 @@ class App(CMainWindow):
         self.occurrence_form._text_color = dark.occurrenceForm.text_color
         self.occurrence_form._input_bg_color = dark.occurrenceForm.fg_color
         self.occurrence_form._input_border = dark.occurrenceForm.border
-        self.table_occurrences._bg_color = dark.occurrenceTable.bg_color
-        self.table_occurrences._text_color = dark.occurrenceTable.text_color
-        self.table_occurrences._fg_color = dark.occurrenceTable.fg_color
-        self.table_occurrences.btn_update._bg_color = "#001C00"
-        self.table_occurrences.btn_update._hover_bg_color = "#003000"
+
+        if self.table_panel is not None:
+            self.table_panel._bg_color = dark.window.bg_color
+            self.input_search._bg_color = dark.occurrenceForm.fg_color
+            self.input_search._text_color = dark.occurrenceForm.text_color
+            self.table_occurrences._bg_color = dark.occurrenceTable.bg_color
+            self.table_occurrences._text_color = dark.occurrenceTable.text_color
+            self.table_occurrences._fg_color = dark.occurrenceTable.fg_color
+            self.table_occurrences._hover_bg_color = dark.occurrenceTable.hover_bg_color
+            self.table_occurrences.btn_update._bg_color = "#001C00"
+            self.table_occurrences.btn_update._hover_bg_color = "#003000"
+            self.table_occurrences.btn_export._bg_color = "#001A33"
+            self.table_occurrences.btn_export._hover_bg_color = "#002A52"
 
     def setTheme(self, theme: Themes):
         if theme == Themes.light:
@@ -240,24 +325,34 @@ class App(CMainWindow):
         else:
             raise ValueError
 
+    @profiled("toggle_theme")
     def toggle_theme(self):
-        self.hide()
-
         self.theme: Themes = (
             self.theme_light if self.theme == self.theme_dark else self.theme_dark
         )
-        self.setTheme(self.theme)
-
-        self.update_styles()
-        self.content.update_styles()
-        self.occurrence_form.update_styles()
-        self.table_occurrences.update_styles()
-        self.table_occurrences.btn_update.update_styles()
-
         self.btn_toggle_theme.switch_theme()
 
-        time.sleep(1)
-        self.show()
+        # Cliques rápidos são agrupados: só o tema final é aplicado
+        self.scheduler.schedule("theme", self.apply_theme, delay=50)
+
+    @profiled("apply_theme")
+    def apply_theme(self):
+        # Sem pintar no meio da troca: tudo é reestilizado e a janela repinta uma vez
+        self.setUpdatesEnabled(False)
+        try:
+            self.setTheme(self.theme)
+
+            self.update_styles()
+            self.content.update_styles()
+            self.occurrence_form.update_styles()
+            if self.table_panel is not None:
+                self.table_panel.update_styles()
+                self.input_search.update_styles()
+                self.table_occurrences.update_styles()
+                self.table_occurrences.btn_update.update_styles()
+                self.table_occurrences.btn_export.update_styles()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -267,13 +362,19 @@ class App(CMainWindow):
         else:
             self.btn_toggle_theme.show()
 
-        if self.width() <= 1000 and self.height() >= 600:
-            self.table_occurrences.hide()
-        else:
-            self.table_occurrences.show()
+        self.update_table_visibility()
 
         # print(self.width(), self.height())
 
+    def update_table_visibility(self):
+        if self.table_panel is None:
+            return
+
+        if self.width() <= 1000 and self.height() >= 600:
+            self.table_panel.hide()
+        else:
+            self.table_panel.show()
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Return and event.modifiers() & Qt.ControlModifier:
             # Ação para Ctrl + Enter
@@ -287,85 +388,35 @@ class App(CMainWindow):
             pass
 
     def create_db(self):
-        db_path = "app/database/database.db"
-        db_dir = os.path.dirname(db_path)
-
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-
-        with SQLiteManager(db_name=db_path) as db:
-            db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS occurrences (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    phone TEXT,
-                    highway TEXT,
-                    km INTEGER,
-                    direction TEXT,
-                    vehicle TEXT,
-                    color TEXT,
-                    license_plate TEXT,
-                    problem TEXT,
-                    occupantes TEXT,
-                    local TEXT,
-                    reference_point TEXT,
-                    observations TEXT,
-                    is_vehicle BOOLEAN
-                );
-            """
-            )
-
-            self.responseSearch = db.searchPagination(
-                search=self.search, page=self.page, rows=self.rows
-            )
-            self.total_pages = self.responseSearch.total_pages
-            self.total_rows = self.responseSearch.total_rows
-
-    def next_page(self):
-        if self.page < self.total_pages:
-            self.page += 1
-            self.load_page()
-
-    def previous_page(self):
-        if self.page > 1:
-            self.page -= 1
-            self.load_page()
+        # As migrações rodam no worker, antes de qualquer consulta da fila
+        self.db_worker.submit(bootstrap, self.db_name).then(on_error=self.show_error)
 
     def load_page(self):
-        self.table_occurrences.setRowCount(0)
-
-        db_path = "app/database/database.db"
-
-        with SQLiteManager(db_name=db_path) as db:
-            response = db.searchPagination(
-                search=self.search, page=self.page, rows=self.rows
-            )
-            self.page, self.total_pages, self.total_rows, data = (
-                response.page,
-                response.total_pages,
-                response.total_rows,
-                response.data,
-            )
-
-            for oc in data:
-                self.table_occurrences.add_row(
-                    [
-                        str(oc.id),
-                        oc.name,
-                        oc.phone,
-                        oc.highway,
-                        str(oc.km) or "",
-                        oc.direction,
-                        oc.problem,
-                        oc.local,
-                        oc.reference_point,
-                    ]
-                )
+        # A busca roda no worker; `set_total_rows` é chamado quando o lote chega
+        self.occurrences_model.set_search(self.search)
+
+    def set_total_rows(self, total_rows: int):
+        self.total_rows = total_rows
+
+    def show_error(self, error: Exception):
+        message = CMessageBox(
+            self, title="Atenção", text=str(error), icon_type=CMessageBox.Icon.critical
+        )
+        message.show()
 
 
 if __name__ == "__main__":
+    startup = StartupPipeline(started_at=STARTED_AT)
+    startup.mark("imports")
     app = QApplication(sys.argv)
-    window = App()
+    startup.mark("QApplication")
+    watchdog = StallWatchdog.from_environment(parent=app)
+    if watchdog is not None:
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+    window = App(startup=startup)
+    startup.mark("janela montada")
     window.show()
+    # Escritas ainda na fila terminam antes de o pool de conexões ser fechado
+    app.aboutToQuit.connect(DatabaseWorker.instance().wait)
     sys.exit(app.exec())